@@ -82,18 +82,21 @@ class Cell(Organelle):
         Dict[str, float]
             A dictionary containing the current state of the cell.
         """
+        metabolites = self.metabolites
+        atp = metabolites["atp"].quantity
+        nadh = metabolites["nadh"].quantity
         return {
             "simulation_time": self.simulation_time,
             "glucose_processed": glucose_processed,
             "total_atp_produced": total_atp_produced,
-            "cytoplasm_atp": self.metabolites["atp"].quantity,
-            "mitochondrion_atp": self.metabolites["atp"].quantity,
-            "cytoplasm_nadh": self.metabolites["nadh"].quantity,
-            "mitochondrion_nadh": self.metabolites["nadh"].quantity,
-            "mitochondrion_fadh2": self.metabolites["fadh2"].quantity,
-            "mitochondrial_calcium": self.metabolites["calcium"].quantity,
+            "cytoplasm_atp": atp,
+            "mitochondrion_atp": atp,
+            "cytoplasm_nadh": nadh,
+            "mitochondrion_nadh": nadh,
+            "mitochondrion_fadh2": metabolites["fadh2"].quantity,
+            "mitochondrial_calcium": metabolites["calcium"].quantity,
             "proton_gradient": self.mitochondrion.proton_gradient,
-            "oxygen_remaining": self.metabolites["oxygen"].quantity,
+            "oxygen_remaining": metabolites["oxygen"].quantity,
         }
 
     def reset(self) -> None:
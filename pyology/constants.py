@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import IntEnum
 
 # Mitochondrion constants
 CALCIUM_THRESHOLD = 800
@@ -33,16 +33,14 @@ TIME_STEP = 0.1
 SIMULATION_DURATION = 5
 
 
-class GlycolysisSteps(Enum):
-    STEP1_HEXOKINASE = "step1_hexokinase"
-    STEP2_PHOSPHOGLUCOSE_ISOMERASE = "step2_phosphoglucose_isomerase"
-    STEP3_PHOSPHOFRUCTOKINASE = "step3_phosphofructokinase"
-    STEP4_ALDOLASE = "step4_aldolase"
-    STEP5_TRIOSE_PHOSPHATE_ISOMERASE = "step5_triose_phosphate_isomerase"
-    STEP6_GLYCERALDEHYDE_3_PHOSPHATE_DEHYDROGENASE = (
-        "step6_glyceraldehyde_3_phosphate_dehydrogenase"
-    )
-    STEP7_PHOSPHOGLYCERATE_KINASE = "step7_phosphoglycerate_kinase"
-    STEP8_PHOSPHOGLYCERATE_MUTASE = "step8_phosphoglycerate_mutase"
-    STEP9_ENOLASE = "step9_enolase"
-    STEP10_PYRUVATE_KINASE = "step10_pyruvate_kinase"
+class GlycolysisSteps(IntEnum):
+    STEP1_HEXOKINASE = 0
+    STEP2_PHOSPHOGLUCOSE_ISOMERASE = 1
+    STEP3_PHOSPHOFRUCTOKINASE = 2
+    STEP4_ALDOLASE = 3
+    STEP5_TRIOSE_PHOSPHATE_ISOMERASE = 4
+    STEP6_GLYCERALDEHYDE_3_PHOSPHATE_DEHYDROGENASE = 5
+    STEP7_PHOSPHOGLYCERATE_KINASE = 6
+    STEP8_PHOSPHOGLYCERATE_MUTASE = 7
+    STEP9_ENOLASE = 8
+    STEP10_PYRUVATE_KINASE = 9
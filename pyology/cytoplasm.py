@@ -55,13 +55,15 @@ class Cytoplasm(Organelle):
             obj=self,
             command=Glycolysis.perform,
             tracked_attributes=tracked_attributes,
-            args=[glucose_amount],
+            args=[self, glucose_amount, self.logger],
             validations=[validate_conservation],
         )
 
         result = execute_command(self, command_data, self.logger, self.debug)
 
-        return result["result"]  # This should be the amount of pyruvate produced
+        _, pyruvate_produced = result.result
+        return pyruvate_produced
 
     def reset(self) -> None:
-        self.__init__()
+        """Reset the cytoplasm to its initial state."""
+        super().reset()
@@ -2,6 +2,8 @@
 Class representing a gene.
 """
 
+import math
+
 
 class Gene:
     """
@@ -26,6 +28,8 @@ class Gene:
         Gets the expression level of the gene.
     """
 
+    __slots__ = ("name", "sequence", "expression_level", "regulators")
+
     def __init__(self, name: str, sequence: str, expression_level: float = 1.0) -> None:
         self.name: str = name
         self.sequence: str = sequence
@@ -37,7 +41,7 @@ class Gene:
 
     def get_expression_level(self) -> float:
         # Modify expression level based on regulators
-        level = self.expression_level
-        for regulator in self.regulators:
-            level *= regulator.effect
-        return level
+        return math.prod(
+            (regulator.effect for regulator in self.regulators),
+            start=self.expression_level,
+        )
@@ -1,10 +1,11 @@
 import logging
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Dict, Tuple
 
 from utils.command_data import CommandData
 from utils.tracking import execute_command
 
 from .common_reactions import GlycolysisReactions
+from .constants import GlycolysisSteps
 from .energy_calculations import calculate_total_adenine_nucleotides
 from .exceptions import GlycolysisError, ReactionError
 from .pathway import Pathway
@@ -12,6 +13,64 @@ from .pathway import Pathway
 if TYPE_CHECKING:
     from .organelle import Organelle
 
+# Glycolysis reactions in pathway order, indexed by GlycolysisSteps
+GLYCOLYSIS_STEPS = (
+    GlycolysisReactions.hexokinase,
+    GlycolysisReactions.phosphoglucose_isomerase,
+    GlycolysisReactions.phosphofructokinase,
+    GlycolysisReactions.aldolase,
+    GlycolysisReactions.triose_phosphate_isomerase,
+    GlycolysisReactions.glyceraldehyde_3_phosphate_dehydrogenase,
+    GlycolysisReactions.phosphoglycerate_kinase,
+    GlycolysisReactions.phosphoglycerate_mutate,
+    GlycolysisReactions.enolase,
+    GlycolysisReactions.pyruvate_kinase,
+)
+
+
+def _glycolysis_stoichiometry() -> Tuple[Tuple[str, float, float, float], ...]:
+    """
+    Sums the glycolysis reactions for one glucose unit into a flat table.
+
+    One glucose unit runs the investment steps once and the yield steps
+    twice. Each step contributes its signed stoichiometry row; intermediates
+    with zero net flux and no transient draw drop out.
+
+    Returns
+    -------
+    Tuple[Tuple[str, float, float, float], ...]:
+        (metabolite, net change, required per unit, required base) per
+        metabolite. Processing n units one after another needs at least
+        ``n * required_per_unit + required_base`` of the metabolite on hand,
+        accounting for the deepest draw within a unit.
+    """
+    split = GlycolysisSteps.STEP6_GLYCERALDEHYDE_3_PHOSPHATE_DEHYDROGENASE
+    rows = [reaction.stoichiometry for reaction in GLYCOLYSIS_STEPS]
+    sequence = rows[:split] + rows[split:] * 2
+    running: Dict[str, float] = {}
+    lowest: Dict[str, float] = {}
+    for row in sequence:
+        for name, coefficient in row.items():
+            running[name] = running.get(name, 0) + coefficient
+            if coefficient < 0:
+                lowest[name] = min(lowest.get(name, 0), running[name])
+
+    table = []
+    for name, net in running.items():
+        draw = -lowest.get(name, 0)
+        if not (net or draw):
+            continue
+        # Net consumers run lowest in the last unit, net producers in the first
+        per_unit = max(-net, 0)
+        table.append((name, net, per_unit, draw - per_unit))
+    return tuple(table)
+
+
+# Net change and requirements per glucose unit, computed once from the
+# reaction definitions
+GLYCOLYSIS_STOICHIOMETRY = _glycolysis_stoichiometry()
+GLYCOLYSIS_NET = {name: net for name, net, _, _ in GLYCOLYSIS_STOICHIOMETRY}
+
 
 class Glycolysis(Pathway):
     """
@@ -33,6 +92,8 @@ class Glycolysis(Pathway):
     -------
     run:
         Executes the glycolysis pathway for a given number of glucose units.
+    perform:
+        Applies the net stoichiometry of glycolysis for whole glucose units.
     investment_phase:
         Executes the investment phase of glycolysis.
     yield_phase:
@@ -41,6 +102,15 @@ class Glycolysis(Pathway):
 
     time_step = 1
     reactions = GlycolysisReactions
+    investment_steps = GLYCOLYSIS_STEPS[
+        : GlycolysisSteps.STEP6_GLYCERALDEHYDE_3_PHOSPHATE_DEHYDROGENASE
+    ]
+    yield_steps = GLYCOLYSIS_STEPS[
+        GlycolysisSteps.STEP6_GLYCERALDEHYDE_3_PHOSPHATE_DEHYDROGENASE :
+    ]
+    # Bound transform methods, resolved once rather than per glucose unit
+    _investment_transforms = tuple(reaction.transform for reaction in investment_steps)
+    _yield_transforms = tuple(reaction.transform for reaction in yield_steps)
 
     def __init__(self, debug=False):
         self.debug = debug
@@ -133,6 +203,74 @@ class Glycolysis(Pathway):
             logger.error(f"Error during glycolysis: {str(e)}")
             raise GlycolysisError(f"Glycolysis failed: {str(e)}")
 
+    @classmethod
+    def perform(
+        cls, organelle: "Organelle", glucose_units: float, logger: logging.Logger
+    ) -> Tuple[float, float]:
+        """
+        Applies the net stoichiometry of glycolysis for whole glucose units.
+
+        Rather than stepping through the ten reactions per unit, the summed
+        per-unit change is scaled by the number of units and applied once.
+        The whole update is validated before any quantity is changed.
+
+        Parameters
+        ----------
+        organelle: Organelle
+            The organelle to run the glycolysis pathway on.
+        glucose_units: float
+            The number of glucose units to process. Fractional units are
+            truncated.
+        logger: logging.Logger
+            The logger to use for logging messages.
+
+        Returns
+        -------
+        Tuple[float, float]:
+            The net ATP produced and the pyruvate produced, both also
+            applied to the given organelle's metabolites.
+
+        Raises
+        ------
+        GlycolysisError:
+            If there are no whole glucose units to process, or a metabolite is
+            missing, insufficient or would exceed its maximum quantity.
+        """
+        units = int(glucose_units)
+        if units <= 0:
+            raise GlycolysisError("The number of glucose units must be positive.")
+
+        get = organelle.metabolites.get
+        updates = []
+        for name, net, per_unit, base in GLYCOLYSIS_STOICHIOMETRY:
+            metabolite = get(name)
+            if metabolite is None:
+                raise GlycolysisError(f"Unknown metabolite: {name}")
+            quantity = metabolite.quantity
+            if quantity < units * per_unit + base:
+                raise GlycolysisError(
+                    f"Insufficient {name} for {units} glucose units. Available: {quantity}"
+                )
+            new_quantity = quantity + units * net
+            if new_quantity > metabolite.max_quantity:
+                raise GlycolysisError(
+                    f"Cannot exceed max quantity for {name}. Max: {metabolite.max_quantity}, Attempted: {new_quantity}"
+                )
+            updates.append((metabolite, new_quantity))
+
+        for metabolite, new_quantity in updates:
+            metabolite.quantity = new_quantity
+
+        net_atp = units * GLYCOLYSIS_NET["ATP"]
+        pyruvate = units * GLYCOLYSIS_NET["pyruvate"]
+        logger.info(
+            "Glycolysis processed %s glucose units: net ATP %s, pyruvate %s",
+            units,
+            net_atp,
+            pyruvate,
+        )
+        return net_atp, pyruvate
+
     @classmethod
     def investment_phase(
         cls, organelle: "Organelle", glucose_units: float, logger: logging.Logger
@@ -156,24 +294,21 @@ class Glycolysis(Pathway):
         """
         logger.info(f"Starting investment phase with {glucose_units} glucose units")
         initial_atp = organelle.get_metabolite_quantity("ATP")
+        transforms = cls._investment_transforms
 
-        for i in range(glucose_units):
-            logger.info(
-                f"🔄🔄🔄 Processing glucose unit {i+1} of {glucose_units} 🔄🔄🔄"
-            )
-            try:
-                # Steps 1-4 occur once per glucose molecule
-                cls.reactions.hexokinase.transform(organelle=organelle)
-                cls.reactions.phosphoglucose_isomerase.transform(organelle=organelle)
-                cls.reactions.phosphofructokinase.transform(organelle=organelle)
-                cls.reactions.aldolase.transform(organelle=organelle)
-
-                # Step 5 occurs once to convert DHAP to G3P
-                cls.reactions.triose_phosphate_isomerase.transform(organelle=organelle)
+        i = 0
+        try:
+            for i in range(int(glucose_units)):
+                logger.info(
+                    f"🔄🔄🔄 Processing glucose unit {i+1} of {glucose_units} 🔄🔄🔄"
+                )
+                # Steps 1-5 occur once per glucose molecule
+                for transform in transforms:
+                    transform(organelle=organelle)
 
-            except ReactionError as e:
-                logger.error(f"Investment phase failed at glucose unit {i+1}: {str(e)}")
-                raise GlycolysisError(f"Investment phase failed: {str(e)}")
+        except ReactionError as e:
+            logger.error(f"Investment phase failed at glucose unit {i+1}: {str(e)}")
+            raise GlycolysisError(f"Investment phase failed: {str(e)}")
 
         final_atp = organelle.get_metabolite_quantity("ATP")
         logger.info(f"ATP consumed in investment phase: {initial_atp - final_atp}")
@@ -201,20 +336,18 @@ class Glycolysis(Pathway):
         """
         logger.info(f"Starting yield phase with {g3p_units} G3P units")
         initial_atp = organelle.get_metabolite_quantity("ATP")
+        transforms = cls._yield_transforms
 
-        for i in range(g3p_units):
-            logger.info(f"🍀🍀🍀 Processing G3P unit {i+1} of {g3p_units} 🍀🍀🍀")
-            try:
-                cls.reactions.glyceraldehyde_3_phosphate_dehydrogenase.transform(
-                    organelle=organelle
-                )
-                cls.reactions.phosphoglycerate_kinase.transform(organelle=organelle)
-                cls.reactions.phosphoglycerate_mutate.transform(organelle=organelle)
-                cls.reactions.enolase.transform(organelle=organelle)
-                cls.reactions.pyruvate_kinase.transform(organelle=organelle)
-
-            except ReactionError as e:
-                raise GlycolysisError(f"Yield phase failed at G3P unit {i+1}: {str(e)}")
+        i = 0
+        try:
+            for i in range(int(g3p_units)):
+                logger.info(f"🍀🍀🍀 Processing G3P unit {i+1} of {g3p_units} 🍀🍀🍀")
+                # Steps 6-10 occur once per G3P molecule
+                for transform in transforms:
+                    transform(organelle=organelle)
+
+        except ReactionError as e:
+            raise GlycolysisError(f"Yield phase failed at G3P unit {i+1}: {str(e)}")
 
         final_atp = organelle.get_metabolite_quantity("ATP")
         logger.info(f"ATP produced in yield phase: {final_atp - initial_atp}")
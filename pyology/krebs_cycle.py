@@ -32,10 +32,38 @@ class KrebsCycle(Pathway):
     time_step = 1
     reactions = KrebsCycleReactions
 
+    # Cofactors yielded by one canonical turn of the cycle
+    NADH_PER_CYCLE = 3
+    FADH2_PER_CYCLE = 1
+    GTP_PER_CYCLE = 1
+
     def __init__(self, debug=True):
         self.debug = debug
         self.reactions = KrebsCycleReactions()
 
+    @classmethod
+    def stoichiometric_yield(
+        cls, acetyl_coa_units: float
+    ) -> Tuple[float, float, float]:
+        """
+        Returns the cofactors produced by a number of canonical cycle turns.
+
+        Parameters
+        ----------
+        acetyl_coa_units: float
+            The number of acetyl-CoA units processed.
+
+        Returns
+        -------
+        Tuple[float, float, float]:
+            A tuple containing the NADH, FADH2 and GTP produced.
+        """
+        return (
+            cls.NADH_PER_CYCLE * acetyl_coa_units,
+            cls.FADH2_PER_CYCLE * acetyl_coa_units,
+            cls.GTP_PER_CYCLE * acetyl_coa_units,
+        )
+
     def run(
         self, organelle: "Organelle", acetyl_coa_units: float, logger: logging.Logger
     ) -> Tuple[float, float, float]:
@@ -123,10 +151,6 @@ class KrebsCycle(Pathway):
                 self.reactions.fumarase,
                 self.reactions.malate_dehydrogenase,
             ]:
-                logger.info(
-                    f"Executing reaction: {reaction.name}, substrates: {reaction.substrates}"
-                )
-
                 # Execute reaction and track energy changes
                 reaction_energy = reaction.transform(organelle=organelle)
                 energy_produced += reaction_energy
@@ -137,7 +161,8 @@ class KrebsCycle(Pathway):
                 ]:
                     co2_produced += 1
                 logger.info(
-                    f"Energy produced in {reaction.name}: {reaction_energy} kJ/mol"
+                    f"Executed reaction: {reaction.name}, substrates: {reaction.substrates}, "
+                    f"energy produced: {reaction_energy} kJ/mol"
                 )
 
             # Calculate total NADH, FADH2, and GTP produced
@@ -1,14 +1,31 @@
+import sys
+from functools import lru_cache
 from threading import Lock
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
 from .exceptions import (
     InsufficientMetaboliteError,
+    MetaboliteError,
     QuantityError,
     UnknownMetaboliteError,
 )
 
+
+@lru_cache(maxsize=256)
+def _normalize(key: str) -> str:
+    """
+    Returns the canonical form of a metabolite key.
+
+    Keys are lowercased and interned once, then served from a bounded
+    cache, so repeated lookups with the same name skip the string rebuild
+    and hit the storage dict with an identical string object, while
+    one-off keys cannot grow the cache without limit.
+    """
+    return sys.intern(key.lower())
+
+
 gibbs_free_energies = {
     "ATP": 50,
     "ADP": 30,
@@ -50,6 +67,8 @@ class Metabolite:
         The type of the metabolite.
     quantity : float
         The current quantity of the metabolite.
+    initial_quantity : float
+        The quantity the metabolite was created with.
     max_quantity : float
         The maximum quantity of the metabolite.
     min_quantity : float
@@ -69,6 +88,8 @@ class Metabolite:
         Adjusts the quantity of the metabolite by the specified amount.
     reset() -> None:
         Resets the quantity of the metabolite to the minimum quantity.
+    restore() -> None:
+        Restores the quantity of the metabolite to its initial quantity.
     percentage_filled() -> float:
         Returns the percentage of the metabolite's quantity filled.
     to_dict() -> dict:
@@ -79,6 +100,20 @@ class Metabolite:
         Returns a string representation of the metabolite.
     """
 
+    __slots__ = (
+        "name",
+        "label",
+        "type",
+        "_quantity",
+        "initial_quantity",
+        "max_quantity",
+        "min_quantity",
+        "unit",
+        "metadata",
+        "on_change",
+        "lock",
+    )
+
     def __init__(
         self,
         name: str,
@@ -90,10 +125,11 @@ class Metabolite:
         on_change=None,
         type: str = "default",
     ) -> None:
-        self.name = name.lower()
+        self.name = _normalize(name)
         self.label = name
         self.type = type
         self.quantity = float(quantity)
+        self.initial_quantity = self.quantity
         self.max_quantity = float(max_quantity)
         self.min_quantity = float(min_quantity)
         self.unit = unit
@@ -133,6 +169,12 @@ class Metabolite:
             if self.on_change:
                 self.on_change(self)
 
+    def restore(self) -> None:
+        with self.lock:
+            self.quantity = self.initial_quantity
+            if self.on_change:
+                self.on_change(self)
+
     @property
     def percentage_filled(self) -> float:
         return (self.quantity / self.max_quantity) * 100
@@ -213,6 +255,10 @@ class Metabolites:
         Produces specified amounts of metabolites.
     validate_all() -> None:
         Validates all metabolites to ensure quantities are within valid ranges.
+    reset() -> None:
+        Resets all metabolites to their minimum quantities.
+    restore() -> None:
+        Restores all metabolites to their initial quantities in place.
     """
 
     DEFAULT_STATE_ATTRIBUTES = ["quantity", "energy"]
@@ -247,11 +293,12 @@ class Metabolites:
             raise ValueError(
                 f"Initial quantity {quantity} exceeds max quantity {max_quantity}."
             )
-        if name.lower() not in self.data:
+        key = _normalize(name)
+        if key not in self.data:
             metabolite = Metabolite(name, quantity, max_quantity, metadata=metadata)
-            self.data[name.lower()] = metabolite
+            self.data[key] = metabolite
         else:
-            metabolite = self.data[name.lower()]
+            metabolite = self.data[key]
             new_quantity = min(metabolite.quantity + quantity, metabolite.max_quantity)
             metabolite.quantity = new_quantity
 
@@ -295,7 +342,7 @@ class Metabolites:
                 metabolite_max_quantity,
             ) in metabolites.items():
                 self._register(
-                    metabolite_name.lower(),
+                    _normalize(metabolite_name),
                     metabolite_quantity,
                     metabolite_max_quantity,
                     metadata,
@@ -327,10 +374,10 @@ class Metabolites:
             raise TypeError("Metabolite name must be a string.")
         if not isinstance(amount, (int, float)):
             raise TypeError("Amount must be a number.")
-        if name.lower() not in self.data:
+        metabolite = self.data.get(_normalize(name))
+        if metabolite is None:
             raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
 
-        metabolite = self.data[name.lower()]
         new_quantity = metabolite.quantity + amount
 
         if new_quantity < metabolite.min_quantity:
@@ -365,9 +412,68 @@ class Metabolites:
         UnknownMetaboliteError
             If the metabolite does not exist.
         """
-        if name.lower() not in self.data:
+        metabolite = self.data.get(_normalize(name))
+        if metabolite is None:
             raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
-        return self.data[name.lower()].quantity >= amount
+        return metabolite.quantity >= amount
+
+    def _apply_delta(
+        self,
+        changes: Iterable[Tuple[str, float]],
+        sign: int,
+        floor: Optional[float] = None,
+    ) -> None:
+        """
+        Applies signed changes to several metabolites at once.
+
+        Every entry is checked against the running quantity of its
+        metabolite before any quantity changes, so a failure leaves all
+        metabolites untouched. Names that normalize to the same metabolite
+        accumulate.
+
+        Parameters
+        ----------
+        changes : Iterable[Tuple[str, float]]
+            Metabolite names and amounts.
+        sign : int
+            -1 to consume the amounts, 1 to produce them.
+        floor : float, optional
+            The lowest quantity allowed. Defaults to each metabolite's own
+            minimum quantity.
+
+        Raises
+        ------
+        MetaboliteError
+            If an amount is not a number.
+        UnknownMetaboliteError
+            If a metabolite does not exist.
+        InsufficientMetaboliteError
+            If a metabolite would fall below the floor.
+        QuantityError
+            If a metabolite would exceed its maximum quantity.
+        """
+        data = self.data
+        pending = {}
+        for name, amount in changes:
+            if not isinstance(amount, (int, float)):
+                raise MetaboliteError(f"Amount for {name} must be a number.")
+            metabolite = data.get(_normalize(name))
+            if metabolite is None:
+                raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
+            key = id(metabolite)
+            quantity = pending[key][1] if key in pending else metabolite.quantity
+            new_quantity = quantity + sign * amount
+            if new_quantity < (metabolite.min_quantity if floor is None else floor):
+                raise InsufficientMetaboliteError(
+                    f"Insufficient {name} for reaction. Required: {amount}, Available: {quantity}"
+                )
+            if new_quantity > metabolite.max_quantity:
+                raise QuantityError(
+                    f"Cannot exceed max quantity for {name}. Current: {quantity}, Max: {metabolite.max_quantity}, Attempted change: {amount}"
+                )
+            pending[key] = (metabolite, new_quantity)
+        for metabolite, new_quantity in pending.values():
+            metabolite.quantity = new_quantity
 
     def consume(self, **metabolites: float) -> None:
         """
@@ -383,13 +489,7 @@ class Metabolites:
         InsufficientMetaboliteError
             If any metabolite is insufficient for consumption.
         """
-        # First, check availability
-        for name, amount in metabolites.items():
-            if not self.is_metabolite_available(name, amount):
-                raise InsufficientMetaboliteError(f"Insufficient {name} for reaction")
-        # Then, consume them
-        for name, amount in metabolites.items():
-            self.change_metabolite_quantity(name, -amount)
+        self._apply_delta(metabolites.items(), -1)
 
     def produce(self, **metabolites: float) -> None:
         """
@@ -400,10 +500,7 @@ class Metabolites:
         metabolites : dict
             Metabolite names and amounts to produce.
         """
-        for name, amount in metabolites.items():
-            if name.lower() not in self.data:
-                raise UnknownMetaboliteError(f"Unknown metabolite: {name}")
-            self.change_metabolite_quantity(name, amount)
+        self._apply_delta(metabolites.items(), 1)
 
     def validate_all(self) -> None:
         """
@@ -430,14 +527,25 @@ class Metabolites:
         }
 
     def get(self, key: str, default: Metabolite = None) -> Metabolite:
-        return self.data.get(key.lower(), default)
+        # Canonical keys hit directly; others fall back to normalisation
+        metabolite = self.data.get(key)
+        if metabolite is None:
+            metabolite = self.data.get(_normalize(key), default)
+        return metabolite
 
     def reset(self):
         for metabolite in self.data.values():
             metabolite.reset()
 
+    def restore(self):
+        for metabolite in self.data.values():
+            metabolite.restore()
+
     def __getitem__(self, key):
-        normalized_key = key.lower()
+        metabolite = self.data.get(key)
+        if metabolite is not None:
+            return metabolite
+        normalized_key = _normalize(key)
         if normalized_key not in self.data:
             # If the metabolite doesn't exist, create it with default values
             self._register(
@@ -449,10 +557,10 @@ class Metabolites:
         return self.data[normalized_key]
 
     def __setitem__(self, key: str, value: Metabolite) -> None:
-        self.data[key.lower()] = value
+        self.data[_normalize(key)] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.data[key.lower()]
+        del self.data[_normalize(key)]
 
     def __iter__(self):
         return iter(self.data)
@@ -461,7 +569,7 @@ class Metabolites:
         return len(self.data)
 
     def __contains__(self, key: str) -> bool:
-        return key.lower() in self.data
+        return key in self.data or _normalize(key) in self.data
 
     def __repr__(self):
         return f"Metabolites({self.data})"
@@ -516,7 +624,7 @@ class Metabolites:
         bool
             True if the metabolite exists, False otherwise.
         """
-        normalized_key = key.lower()
+        normalized_key = _normalize(key)
         return normalized_key in self.data
 
     def state(self, attributes: list = None) -> dict:
@@ -1,6 +1,6 @@
 import logging
 import math
-from typing import Dict
+from typing import Dict, Iterable, Tuple
 
 from utils.command_data import CommandData
 from utils.tracking import execute_command
@@ -57,6 +57,9 @@ class Mitochondrion(Organelle):
 
     name = "Mitochondrion"
 
+    # Oxygen consumed per unit of pyruvate fully respired
+    O2_PER_PYRUVATE = 2.5
+
     def __init__(self, debug=False) -> None:
         super().__init__()
         self.debug = debug
@@ -80,6 +83,21 @@ class Mitochondrion(Organelle):
         # Initialize all necessary metabolites for the Krebs cycle
         self.initialize_krebs_cycle_metabolites()
 
+        # Bind the electron transport chain metabolites once. Resets restore
+        # quantities in place, so these references stay valid.
+        for metabolite in self._ETC_METABOLITES:
+            if metabolite not in self.metabolites:
+                self.metabolites[metabolite] = Metabolite(
+                    metabolite, 0, max_quantity=100
+                )
+        self._m_oxygen = self.metabolites["oxygen"]
+        self._m_adp = self.metabolites["adp"]
+        self._m_atp = self.metabolites["atp"]
+        self._complex_I = self._bind_complex(self._COMPLEX_I)
+        self._complex_II = self._bind_complex(self._COMPLEX_II)
+        self._complex_III = self._bind_complex(self._COMPLEX_III)
+        self._complex_IV = self._bind_complex(self._COMPLEX_IV)
+
     def initialize_krebs_cycle_metabolites(self):
         krebs_cycle_metabolites = [
             "acetyl_coa",
@@ -102,9 +120,13 @@ class Mitochondrion(Organelle):
         """
         if metabolite not in self.metabolites:
             logger.warning(
-                f"{metabolite} not found in metabolites. Adding it with initial quantity {initial_quantity}."
+                "%s not found in metabolites. Adding it with initial quantity %s.",
+                metabolite,
+                initial_quantity,
+            )
+            self.metabolites[metabolite] = Metabolite(
+                metabolite, initial_quantity, max_quantity=max(initial_quantity, 100)
             )
-            self.metabolites[metabolite] = Metabolite(metabolite, initial_quantity)
 
     def change_metabolite_quantity(self, metabolite: str, amount: float) -> float:
         """
@@ -126,22 +148,76 @@ class Mitochondrion(Organelle):
         float
             The actual amount changed (may be different if preventing negative values).
         """
-        if metabolite not in self.metabolites:
-            self.metabolites[metabolite] = Metabolite(metabolite, 0)
+        slot = self.metabolites.get(metabolite)
+        if slot is None:
+            slot = self.metabolites[metabolite] = Metabolite(
+                metabolite, 0, max_quantity=100
+            )
 
-        current_quantity = self.metabolites[metabolite].quantity
-        new_quantity = max(current_quantity + amount, 0)
+        current_quantity = slot.quantity
+        new_quantity = current_quantity + amount
+        if new_quantity < 0:
+            new_quantity = 0
         actual_change = new_quantity - current_quantity
 
-        self.metabolites[metabolite].quantity = new_quantity
+        slot.quantity = new_quantity
 
         if actual_change != amount:
             logger.warning(
-                f"Attempted to decrease {metabolite} by {-amount}, but only decreased by {-actual_change} to prevent negative quantity."
+                "Attempted to decrease %s by %s, but only decreased by %s to prevent negative quantity.",
+                metabolite,
+                -amount,
+                -actual_change,
             )
 
         return actual_change
 
+    def _try_consume(self, pairs: Iterable[Tuple[str, float]]) -> bool:
+        """
+        Consume metabolites given as (name, amount) pairs.
+
+        Unlike ``Organelle.consume_metabolites``, a failure is logged as a
+        warning and reported as False rather than raised.
+
+        Parameters
+        ----------
+        pairs: Iterable[Tuple[str, float]]
+            The metabolites to consume and their amounts.
+
+        Returns
+        -------
+        bool
+            True if all metabolites were consumed successfully, False otherwise.
+        """
+        try:
+            self.metabolites._apply_delta(pairs, -1, floor=0)
+        except MetaboliteError as error:
+            logger.warning("%s", error)
+            return False
+        return True
+
+    def _produce_clamped(self, pairs: Iterable[Tuple[str, float]]) -> None:
+        """
+        Produce metabolites given as (name, amount) pairs.
+
+        Missing metabolites are created and a quantity is never taken below
+        zero; any shortfall is logged as a warning rather than raised.
+
+        Parameters
+        ----------
+        pairs: Iterable[Tuple[str, float]]
+            The metabolites to produce and their amounts.
+        """
+        for metabolite, amount in pairs:
+            actual_change = self.change_metabolite_quantity(metabolite, amount)
+            if actual_change != amount:
+                logger.warning(
+                    "Could not produce full amount of %s. Produced %s instead of %s.",
+                    metabolite,
+                    actual_change,
+                    amount,
+                )
+
     def consume_metabolites(self, **metabolites: Dict[str, float]) -> bool:
         """
         Consume multiple metabolites at once.
@@ -156,17 +232,7 @@ class Mitochondrion(Organelle):
         bool
             True if all metabolites were consumed successfully, False otherwise.
         """
-        temp_changes = {}
-        for metabolite, amount in metabolites.items():
-            actual_change = self.change_metabolite_quantity(metabolite, -amount)
-            if abs(actual_change) < abs(amount):
-                # Revert changes if not all metabolites could be consumed
-                for rev_metabolite, rev_amount in temp_changes.items():
-                    self.change_metabolite_quantity(rev_metabolite, rev_amount)
-                logger.warning(f"Insufficient {metabolite} for reaction")
-                return False
-            temp_changes[metabolite] = actual_change
-        return True
+        return self._try_consume(metabolites.items())
 
     def produce_metabolites(self, **metabolites: Dict[str, float]) -> None:
         """
@@ -177,12 +243,7 @@ class Mitochondrion(Organelle):
         metabolites: Dict[str, float]
             The metabolites to produce and their amounts.
         """
-        for metabolite, amount in metabolites.items():
-            actual_change = self.change_metabolite_quantity(metabolite, amount)
-            if actual_change != amount:
-                logger.warning(
-                    f"Could not produce full amount of {metabolite}. Produced {actual_change} instead of {amount}."
-                )
+        self._produce_clamped(metabolites.items())
 
     def krebs_cycle_process(self, acetyl_coa_amount: int) -> int:
         """
@@ -202,11 +263,10 @@ class Mitochondrion(Organelle):
             The total amount of NADH and FADH2 produced.
         """
         logger.info(
-            f"Processing {acetyl_coa_amount} units of acetyl-CoA through the Krebs cycle"
+            "Processing %s units of acetyl-CoA through the Krebs cycle",
+            acetyl_coa_amount,
         )
 
-        self.krebs_cycle.add_substrate("glucose", acetyl_coa_amount)
-
         # Ensure there's enough oxaloacetate to start the cycle
         if self.metabolites["oxaloacetate"].quantity < acetyl_coa_amount:
             oxaloacetate_needed = (
@@ -216,22 +276,12 @@ class Mitochondrion(Organelle):
                 logger.warning("Insufficient oxaloacetate to start Krebs cycle")
                 return 0
 
-        total_nadh = 0
-        total_fadh2 = 0
-        total_atp = 0
-
-        for metabolites, cofactors in self.krebs_cycle.krebs_cycle_iterator(
-            num_cycles=acetyl_coa_amount
-        ):
-            total_nadh += cofactors["NADH"]
-            total_fadh2 += cofactors["FADH2"]
-            total_atp += cofactors["GTP"]  # GTP is equivalent to ATP
-
-        # Transfer the products to the mitochondrion
-        self.produce_metabolites(nadh=total_nadh, fadh2=total_fadh2, atp=total_atp)
+        total_nadh, total_fadh2, total_gtp = self.krebs_cycle.stoichiometric_yield(
+            acetyl_coa_amount
+        )
 
-        # Reset the Krebs cycle for the next round
-        self.krebs_cycle.reset()
+        # Transfer the products to the mitochondrion; GTP is equivalent to ATP
+        self.produce_metabolites(nadh=total_nadh, fadh2=total_fadh2, atp=total_gtp)
 
         return total_nadh + total_fadh2
 
@@ -249,7 +299,7 @@ class Mitochondrion(Organelle):
         int
             The amount of acetyl-CoA produced.
         """
-        logger.info(f"Converting {pyruvate_amount} units of pyruvate to Acetyl-CoA")
+        logger.info("Converting %s units of pyruvate to Acetyl-CoA", pyruvate_amount)
         acetyl_coa_produced = pyruvate_amount
         self.change_metabolite_quantity("nadh", pyruvate_amount)
         self.change_metabolite_quantity("co2", pyruvate_amount)
@@ -270,7 +320,7 @@ class Mitochondrion(Organelle):
         float
             The amount of oxygen needed.
         """
-        return pyruvate_amount * 2.5
+        return pyruvate_amount * self.O2_PER_PYRUVATE
 
     def cellular_respiration(self, pyruvate_amount: float) -> float:
         """
@@ -308,23 +358,26 @@ class Mitochondrion(Organelle):
 
         return result["result"]  # This should be the amount of ATP produced
 
-    def calculate_proton_leak(self) -> float:
+    def calculate_proton_leak(self, proton_gradient: float = None) -> float:
         """
         Calculate the proton leak using a logistic function.
 
+        Parameters
+        ----------
+        proton_gradient: float, optional
+            The gradient to evaluate the leak at. Defaults to the current
+            proton gradient.
+
         Returns
         -------
         float
             The amount of proton leak.
         """
-        relative_gradient = self.proton_gradient / self.max_proton_gradient
-        leak = self.leak_rate / (
-            1
-            + math.exp(
-                -self.leak_steepness * (self.proton_gradient - self.leak_midpoint)
-            )
+        if proton_gradient is None:
+            proton_gradient = self.proton_gradient
+        return self.leak_rate / (
+            1 + math.exp(-self.leak_steepness * (proton_gradient - self.leak_midpoint))
         )
-        return leak
 
     def update_proton_gradient(self, protons_pumped: float) -> float:
         """
@@ -340,11 +393,131 @@ class Mitochondrion(Organelle):
         float
             The updated proton gradient.
         """
-        self.proton_gradient += protons_pumped
-        leak = self.calculate_proton_leak()
-        self.proton_gradient = max(0, self.proton_gradient - leak)
-        logger.info(f"Updated proton gradient: {self.proton_gradient:.2f}")
-        return self.proton_gradient
+        gradient = self._pump_protons(protons_pumped)
+        logger.info("Updated proton gradient: %.2f", gradient)
+        return gradient
+
+    def _pump_protons(self, protons_pumped: float) -> float:
+        """
+        Applies pumped protons and the proton leak to the gradient without logging.
+
+        Parameters
+        ----------
+        protons_pumped: float
+            The amount of protons pumped.
+
+        Returns
+        -------
+        float
+            The updated proton gradient.
+        """
+        gradient = self.proton_gradient + protons_pumped
+        gradient -= self.calculate_proton_leak(gradient)
+        if gradient < 0:
+            gradient = 0
+        self.proton_gradient = gradient
+        return gradient
+
+    def _bind_complex(self, table: tuple) -> tuple:
+        """
+        Resolves the substrates of a complex table to their Metabolite objects.
+
+        Parameters
+        ----------
+        table: tuple
+            A (substrates, products, protons pumped) complex table.
+
+        Returns
+        -------
+        tuple
+            The table with each substrate name replaced by its Metabolite.
+        """
+        substrates, products, protons_per_unit = table
+        metabolites = self.metabolites
+        return (
+            tuple((metabolites[name], coefficient) for name, coefficient in substrates),
+            products,
+            protons_per_unit,
+        )
+
+    def _run_complex(
+        self,
+        substrates: Tuple[Tuple[Metabolite, float], ...],
+        products: Tuple[Tuple[str, float], ...],
+        protons_per_unit: float,
+    ) -> float:
+        """
+        Runs one electron transport chain complex as far as its substrates allow.
+
+        The reaction proceeds at the largest rate every substrate can
+        support, given as a (metabolite, coefficient) stoichiometry table.
+
+        Parameters
+        ----------
+        substrates: Tuple[Tuple[Metabolite, float], ...]
+            The metabolites consumed per unit of reaction.
+        products: Tuple[Tuple[str, float], ...]
+            The metabolites produced per unit of reaction.
+        protons_per_unit: float
+            The protons pumped per unit of reaction.
+
+        Returns
+        -------
+        float
+            The reaction rate, or 0 if any substrate is short of one unit.
+        """
+        reaction_rate = None
+        for slot, coefficient in substrates:
+            if slot.quantity < coefficient:
+                return 0
+            supported = slot.quantity / coefficient
+            if reaction_rate is None or supported < reaction_rate:
+                reaction_rate = supported
+
+        for slot, coefficient in substrates:
+            slot.quantity -= coefficient * reaction_rate
+        self._produce_clamped(
+            [(name, coefficient * reaction_rate) for name, coefficient in products]
+        )
+        if protons_per_unit:
+            self._pump_protons(protons_per_unit * reaction_rate)
+        return reaction_rate
+
+    # Registered empty when missing, so binding them never auto-creates
+    _ETC_METABOLITES = (
+        "nadh",
+        "fadh2",
+        "oxygen",
+        "adp",
+        "atp",
+        "ubiquinone",
+        "ubiquinol",
+        "cytochrome_c_oxidized",
+        "cytochrome_c_reduced",
+    )
+
+    # (substrates, products, protons pumped) per unit of each complex
+    _COMPLEX_I = (
+        (("nadh", 1), ("ubiquinone", 1)),
+        (("ubiquinol", 1),),
+        PROTONS_PER_NADH,
+    )
+    _COMPLEX_II = (
+        (("fadh2", 1), ("ubiquinone", 1)),
+        (("ubiquinol", 1),),
+        0,
+    )
+    _COMPLEX_III = (
+        (("ubiquinol", 1), ("cytochrome_c_oxidized", 1)),
+        (("ubiquinone", 1), ("cytochrome_c_reduced", 1)),
+        PROTONS_PER_FADH2,
+    )
+    # 2 cytochrome c per O2
+    _COMPLEX_IV = (
+        (("cytochrome_c_reduced", 1), ("oxygen", 0.5)),
+        (("cytochrome_c_oxidized", 1),),
+        PROTONS_PER_FADH2,
+    )
 
     def complex_I(self) -> int:
         """
@@ -358,20 +531,14 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available("nadh", 1) and self.is_metabolite_available(
-            "ubiquinone", 1
-        ):
-            reaction_rate = min(
-                self.metabolites["nadh"].quantity,
-                self.metabolites["ubiquinone"].quantity,
+        reaction_rate = self._run_complex(*self._complex_I)
+        if reaction_rate:
+            logger.info(
+                "Complex I: Oxidized %s NADH, pumped %s protons",
+                reaction_rate,
+                PROTONS_PER_NADH * reaction_rate,
             )
-            if self.consume_metabolites(nadh=reaction_rate, ubiquinone=reaction_rate):
-                self.produce_metabolites(ubiquinol=reaction_rate)
-                self.update_proton_gradient(PROTONS_PER_NADH * reaction_rate)  # Updated
-                logger.info(
-                    f"Complex I: Oxidized {reaction_rate} NADH, pumped {PROTONS_PER_NADH * reaction_rate} protons"
-                )
-                return reaction_rate
+            return reaction_rate
         logger.warning("Insufficient NADH or ubiquinone for Complex I")
         return 0
 
@@ -387,17 +554,10 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available("fadh2", 1) and self.is_metabolite_available(
-            "ubiquinone", 1
-        ):
-            reaction_rate = min(
-                self.metabolites["fadh2"].quantity,
-                self.metabolites["ubiquinone"].quantity,
-            )
-            if self.consume_metabolites(fadh2=reaction_rate, ubiquinone=reaction_rate):
-                self.produce_metabolites(ubiquinol=reaction_rate)
-                logger.info(f"Complex II: Oxidized {reaction_rate} FADH2")
-                return reaction_rate
+        reaction_rate = self._run_complex(*self._complex_II)
+        if reaction_rate:
+            logger.info("Complex II: Oxidized %s FADH2", reaction_rate)
+            return reaction_rate
         logger.warning("Insufficient FADH2 or ubiquinone for Complex II")
         return 0
 
@@ -413,24 +573,14 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available(
-            "ubiquinol", 1
-        ) and self.is_metabolite_available("cytochrome_c_oxidized", 1):
-            reaction_rate = min(
-                self.metabolites["ubiquinol"].quantity,
-                self.metabolites["cytochrome_c_oxidized"].quantity,
+        reaction_rate = self._run_complex(*self._complex_III)
+        if reaction_rate:
+            logger.info(
+                "Complex III: Transferred %s electron pairs, pumped %s protons",
+                reaction_rate,
+                PROTONS_PER_FADH2 * reaction_rate,
             )
-            if self.consume_metabolites(
-                ubiquinol=reaction_rate, cytochrome_c_oxidized=reaction_rate
-            ):
-                self.produce_metabolites(
-                    ubiquinone=reaction_rate, cytochrome_c_reduced=reaction_rate
-                )
-                self.update_proton_gradient(PROTONS_PER_FADH2 * reaction_rate)
-                logger.info(
-                    f"Complex III: Transferred {reaction_rate} electron pairs, pumped {PROTONS_PER_FADH2 * reaction_rate} protons"
-                )
-                return reaction_rate
+            return reaction_rate
         logger.warning("Insufficient ubiquinol or cytochrome c for Complex III")
         return 0
 
@@ -446,24 +596,15 @@ class Mitochondrion(Organelle):
         int
             The amount of electrons transferred.
         """
-        if self.is_metabolite_available(
-            "cytochrome_c_reduced", 1
-        ) and self.is_metabolite_available("oxygen", 0.5):
-            reaction_rate = min(
-                self.metabolites["cytochrome_c_reduced"].quantity,
-                self.metabolites["oxygen"].quantity * 2,
-            )  # 2 cytochrome c per O2
-            oxygen_consumed = reaction_rate / 2
-            if self.consume_metabolites(
-                cytochrome_c_reduced=reaction_rate, oxygen=oxygen_consumed
-            ):
-                self.produce_metabolites(cytochrome_c_oxidized=reaction_rate)
-                self.update_proton_gradient(PROTONS_PER_FADH2 * reaction_rate)
-                logger.info(
-                    f"Complex IV: Consumed {oxygen_consumed} O2, pumped {PROTONS_PER_FADH2 * reaction_rate} protons"
-                )
-                return reaction_rate
-        if self.metabolites["oxygen"].quantity <= 0:
+        reaction_rate = self._run_complex(*self._complex_IV)
+        if reaction_rate:
+            logger.info(
+                "Complex IV: Consumed %s O2, pumped %s protons",
+                reaction_rate / 2,
+                PROTONS_PER_FADH2 * reaction_rate,
+            )
+            return reaction_rate
+        if self._m_oxygen.quantity <= 0:
             logger.warning("Insufficient oxygen for Complex IV")
         else:
             logger.warning("Insufficient reduced cytochrome c for Complex IV")
@@ -485,11 +626,11 @@ class Mitochondrion(Organelle):
         bool
             True if the metabolite is available in sufficient quantity, False otherwise.
         """
-        if hasattr(self, metabolite):
-            return getattr(self, metabolite).quantity >= amount
-        else:
-            logger.warning(f"Unknown metabolite: {metabolite}")
+        slot = self.metabolites.get(metabolite)
+        if slot is None:
+            logger.warning("Unknown metabolite: %s", metabolite)
             return False
+        return slot.quantity >= amount
 
     def atp_synthase(self) -> int:
         """
@@ -500,16 +641,70 @@ class Mitochondrion(Organelle):
         int
             The amount of ATP produced.
         """
-        protons_required_per_atp = PROTONS_PER_ATP
-        possible_atp = int(self.proton_gradient / protons_required_per_atp)
-        atp_produced = min(possible_atp, self.metabolites["adp"].quantity)
-        if self.consume_metabolites(adp=atp_produced):
-            self.produce_metabolites(atp=atp_produced)
-            self.proton_gradient -= atp_produced * protons_required_per_atp
-            logger.info(f"ATP Synthase: Produced {atp_produced} ATP")
-            return atp_produced
-        logger.warning("Insufficient ADP for ATP synthesis")
-        return 0
+        atp_produced = self._synthesize_atp()
+        if atp_produced:
+            logger.info("ATP Synthase: Produced %s ATP", atp_produced)
+        return atp_produced
+
+    def _synthesize_atp(self) -> int:
+        """
+        Converts ADP to ATP as far as the proton gradient allows, without
+        logging the result.
+
+        Returns
+        -------
+        int
+            The amount of ATP produced.
+        """
+        proton_gradient = self.proton_gradient
+        adp = self._m_adp
+        adp_quantity = adp.quantity
+        if adp_quantity <= 0:
+            logger.warning("Insufficient ADP for ATP synthesis")
+            return 0
+        possible_atp = int(proton_gradient / PROTONS_PER_ATP)
+        if possible_atp <= 0:
+            # A low gradient is the normal state between pumping steps
+            logger.debug("Proton gradient too low for ATP synthesis")
+            return 0
+        # Bounded by the ADP on hand, so the conversion cannot fall short
+        atp_produced = possible_atp if possible_atp < adp_quantity else adp_quantity
+        adp.quantity = adp_quantity - atp_produced
+        self._m_atp.quantity += atp_produced
+        self.proton_gradient = proton_gradient - atp_produced * PROTONS_PER_ATP
+        return atp_produced
+
+    def _convert(self, source: str, target: str) -> float:
+        """
+        Converts as much of one metabolite into another as the target can hold.
+
+        Both metabolites are resolved once and updated directly, instead of
+        going through separate availability and quantity-change calls.
+
+        Parameters
+        ----------
+        source: str
+            The metabolite to convert from.
+        target: str
+            The metabolite to convert to.
+
+        Returns
+        -------
+        float
+            The amount converted.
+        """
+        source_metabolite = self.metabolites[source]
+        target_metabolite = self.metabolites[target]
+        amount = min(
+            source_metabolite.quantity,
+            target_metabolite.max_quantity - target_metabolite.quantity,
+        )
+        if amount > 0:
+            source_metabolite.quantity -= amount
+            target_metabolite.quantity += amount
+        else:
+            amount = 0
+        return amount
 
     def replenish_ubiquinone(self) -> int:
         """
@@ -520,14 +715,9 @@ class Mitochondrion(Organelle):
         int
             The amount of ubiquinone replenished.
         """
-        replenish_amount = min(
-            self.metabolites["ubiquinol"].quantity,
-            self.metabolites["ubiquinone"].max_quantity
-            - self.metabolites["ubiquinone"].quantity,
-        )
-        self.change_metabolite_quantity("ubiquinone", replenish_amount)
-        self.change_metabolite_quantity("ubiquinol", -replenish_amount)
-        logger.info(f"Replenished {replenish_amount} ubiquinone")
+        replenish_amount = self._convert("ubiquinol", "ubiquinone")
+        logger.info("Replenished %s ubiquinone", replenish_amount)
+        return replenish_amount
 
     def replenish_cytochrome_c(self) -> int:
         """
@@ -538,14 +728,11 @@ class Mitochondrion(Organelle):
         int
             The amount of oxidized cytochrome c replenished.
         """
-        replenish_amount = min(
-            self.metabolites["cytochrome_c_reduced"].quantity,
-            self.metabolites["cytochrome_c_oxidized"].max_quantity
-            - self.metabolites["cytochrome_c_oxidized"].quantity,
+        replenish_amount = self._convert(
+            "cytochrome_c_reduced", "cytochrome_c_oxidized"
         )
-        self.change_metabolite_quantity("cytochrome_c_oxidized", replenish_amount)
-        self.change_metabolite_quantity("cytochrome_c_reduced", -replenish_amount)
-        logger.info(f"Replenished {replenish_amount} oxidized cytochrome c")
+        logger.info("Replenished %s oxidized cytochrome c", replenish_amount)
+        return replenish_amount
 
     def oxidative_phosphorylation(self, cytoplasmic_nadh_used: int = 0) -> int:
         """
@@ -561,32 +748,44 @@ class Mitochondrion(Organelle):
         int
             The amount of ATP produced.
         """
-        if self.metabolites["oxygen"].quantity <= 0:
+        if self._m_oxygen.quantity <= 0:
             logger.warning("No oxygen available. Oxidative phosphorylation halted.")
             return 0
 
-        total_nadh = self.metabolites["nadh"].quantity + cytoplasmic_nadh_used
-
-        # Run the electron transport chain
-        electrons_through_complex_I = self.complex_I()
-        electrons_through_complex_II = self.complex_II()
-        electrons_through_complex_III = self.complex_III()
-        electrons_through_complex_IV = self.complex_IV()
+        # Run the electron transport chain. The steps are called without
+        # their own logging and the results reported in one record below.
+        run_complex = self._run_complex
+        electrons_through_complex_I = run_complex(*self._complex_I)
+        electrons_through_complex_II = run_complex(*self._complex_II)
+        electrons_through_complex_III = run_complex(*self._complex_III)
+        electrons_through_complex_IV = run_complex(*self._complex_IV)
 
         # ATP production via ATP synthase
-        atp_produced = self.atp_synthase()
+        atp_produced = self._synthesize_atp()
 
         # Replenish ubiquinone and cytochrome c
-        self.replenish_ubiquinone()
-        self.replenish_cytochrome_c()
+        ubiquinone_replenished = self._convert("ubiquinol", "ubiquinone")
+        cytochrome_c_replenished = self._convert(
+            "cytochrome_c_reduced", "cytochrome_c_oxidized"
+        )
 
         # Calculate efficiency
         total_electrons = electrons_through_complex_I + electrons_through_complex_II
-        if total_electrons > 0:
-            efficiency = atp_produced / total_electrons
-            logger.info(
-                f"Oxidative phosphorylation efficiency: {efficiency:.2f} ATP per electron pair"
-            )
+        efficiency = atp_produced / total_electrons if total_electrons > 0 else 0
+        logger.info(
+            "Oxidative phosphorylation: complexes I-IV %s/%s/%s/%s, ATP %s, "
+            "proton gradient %.2f, replenished ubiquinone %s and cytochrome c %s, "
+            "efficiency %.2f ATP per electron pair",
+            electrons_through_complex_I,
+            electrons_through_complex_II,
+            electrons_through_complex_III,
+            electrons_through_complex_IV,
+            atp_produced,
+            self.proton_gradient,
+            ubiquinone_replenished,
+            cytochrome_c_replenished,
+            efficiency,
+        )
 
         return atp_produced
 
@@ -604,15 +803,21 @@ class Mitochondrion(Organelle):
         float
             The amount of calcium buffered.
         """
-        calcium_uptake = min(
-            cytoplasmic_calcium,
-            self.metabolites["calcium"].max_quantity
-            - self.metabolites["calcium"].quantity,
-        )
-        self.change_metabolite_quantity("calcium", calcium_uptake)
-        logger.info(f"Mitochondrion buffered {calcium_uptake:.2f} units of calcium")
+        # Clip the uptake to [0, headroom] so the update needs no clamping
+        calcium = self.metabolites["calcium"]
+        quantity = calcium.quantity
+        headroom = calcium.max_quantity - quantity
+        if cytoplasmic_calcium <= 0:
+            calcium_uptake = 0
+        elif cytoplasmic_calcium < headroom:
+            calcium_uptake = cytoplasmic_calcium
+        else:
+            calcium_uptake = headroom
+        quantity += calcium_uptake
+        calcium.quantity = quantity
+        logger.info("Mitochondrion buffered %.2f units of calcium", calcium_uptake)
 
-        if self.metabolites["calcium"].quantity > self.calcium_threshold:
+        if quantity > self.calcium_threshold:
             logger.warning(
                 "Calcium overload detected. Risk of mitochondrial dysfunction."
             )
@@ -633,14 +838,19 @@ class Mitochondrion(Organelle):
         float
             The amount of calcium released.
         """
-        released = min(amount, self.metabolites["calcium"].quantity)
-        self.change_metabolite_quantity("calcium", -released)
-        logger.info(f"Mitochondrion released {released:.2f} units of calcium")
+        calcium = self.metabolites["calcium"]
+        released = min(amount, calcium.quantity)
+        if released > 0:
+            calcium.quantity -= released
+        else:
+            released = 0
+        logger.info("Mitochondrion released %.2f units of calcium", released)
         return released
 
     def reset(self) -> None:
         """Reset mitochondrion state."""
-        self.__init__()
+        super().reset()
+        self.proton_gradient = 0
         logger.info("Mitochondrion state reset")
 
     def transfer_cytoplasmic_nadh(self, cytoplasmic_nadh: float) -> float:
@@ -662,6 +872,8 @@ class Mitochondrion(Organelle):
         mitochondrial_nadh = int(cytoplasmic_nadh * shuttle_efficiency)
         self.metabolites["nadh"].quantity += mitochondrial_nadh
         logger.info(
-            f"Transferred {cytoplasmic_nadh} cytoplasmic NADH, produced {mitochondrial_nadh} mitochondrial NADH"
+            "Transferred %s cytoplasmic NADH, produced %s mitochondrial NADH",
+            cytoplasmic_nadh,
+            mitochondrial_nadh,
         )
         return mitochondrial_nadh
@@ -1,13 +1,14 @@
 import json
 import os
 from dataclasses import dataclass, field
-from typing import List
+from types import MappingProxyType
+from typing import List, Mapping
 
 import yaml
 
 from .exceptions import (
     GlycolysisRateError,
-    InsufficientMetaboliteError,
+    MetaboliteError,
     QuantityError,
     UnknownMetaboliteError,
 )
@@ -93,16 +94,16 @@ class OrganelleMeta(type):
         return new_class
 
     @classmethod
-    def get_registry(cls: type) -> dict:
+    def get_registry(cls: type) -> Mapping:
         """
         Returns the registry of organelle classes.
 
         Returns
         -------
-        dict
-            The registry of organelle classes.
+        Mapping
+            A read-only view of the registry of organelle classes.
         """
-        return dict(cls._registry)
+        return MappingProxyType(cls._registry)
 
 
 class Organelle(metaclass=OrganelleMeta):
@@ -132,6 +133,8 @@ class Organelle(metaclass=OrganelleMeta):
         Consumes metabolites from the organelle.
     produce_metabolites(self, **metabolites: float) -> None:
         Produces metabolites in the organelle.
+    reset(self) -> None:
+        Restores the organelle's metabolites to their initial quantities.
     """
 
     name = "Organelle"
@@ -151,6 +154,16 @@ class Organelle(metaclass=OrganelleMeta):
             raise GlycolysisRateError(f"Invalid glycolysis rate: {value}")
         self._glycolysis_rate = value
 
+    def reset(self) -> None:
+        """
+        Restores the organelle's metabolites to their initial quantities.
+
+        The existing Metabolite objects are updated in place rather than
+        rebuilt, so references held by callers stay valid across resets.
+        """
+        self.metabolites.restore()
+        self._glycolysis_rate = 1.0
+
     def validate_initial_state(self) -> None:
         """
         Validates the initial state of the organelle, including metabolite
@@ -229,15 +242,17 @@ class Organelle(metaclass=OrganelleMeta):
             If the metabolite name is not a string or the amount is not a number.
         UnknownMetaboliteError
             If the metabolite is not found in the organelle.
+        QuantityError
+            If the change would take the quantity out of its valid range.
         """
         if not isinstance(metabolite_name, str):
             raise MetaboliteError("Metabolite name must be a string.")
         if not isinstance(amount, (int, float)):
             raise MetaboliteError("Amount must be a number.")
-        if metabolite_name not in self.metabolites:
+        metabolite = self.metabolites.get(metabolite_name)
+        if metabolite is None:
             raise UnknownMetaboliteError(f"Unknown metabolite: {metabolite_name}")
 
-        metabolite = self.metabolites[metabolite_name]
         new_quantity = metabolite.quantity + amount
 
         if new_quantity < 0:
@@ -280,29 +295,49 @@ class Organelle(metaclass=OrganelleMeta):
         """
         Consumes metabolites from the organelle.
 
+        All metabolites are checked before any quantity is changed, so a
+        failed consumption, including one with an invalid amount, leaves the
+        organelle untouched.
+
         Parameters
         ----------
         metabolites : dict
             A dictionary of metabolites to consume.
+
+        Raises
+        ------
+        MetaboliteError
+            If an amount is not a number.
+        UnknownMetaboliteError
+            If a metabolite is not found in the organelle.
+        InsufficientMetaboliteError
+            If a metabolite is not available in the required amount.
         """
-        for metabolite, amount in metabolites.items():
-            if not self.is_metabolite_available(metabolite, amount):
-                raise InsufficientMetaboliteError(
-                    f"Insufficient {metabolite} for reaction. Required: {amount}, Available: {self.metabolites[metabolite].quantity}"
-                )
-            self.change_metabolite_quantity(metabolite, -amount)
+        self.metabolites._apply_delta(metabolites.items(), -1, floor=0)
 
     def produce_metabolites(self, **metabolites: float) -> None:
         """
         Produces metabolites in the organelle.
 
+        All metabolites are checked before any quantity is changed, so a
+        failed production, including one with an invalid amount, leaves the
+        organelle untouched.
+
         Parameters
         ----------
         metabolites : dict
             A dictionary of metabolites to produce.
+
+        Raises
+        ------
+        MetaboliteError
+            If an amount is not a number.
+        UnknownMetaboliteError
+            If a metabolite is not found in the organelle.
+        QuantityError
+            If producing a metabolite would exceed its maximum quantity.
         """
-        for metabolite, amount in metabolites.items():
-            self.change_metabolite_quantity(metabolite, amount)
+        self.metabolites._apply_delta(metabolites.items(), 1, floor=0)
 
     def get_metabolite_quantity(self, metabolite: str) -> float:
         """
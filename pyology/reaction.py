@@ -35,12 +35,21 @@ class Reaction:
             A dictionary of product names and their quantities.
         reversible : bool, optional
             Whether the reaction is reversible. Defaults to False.
+
+        Attributes
+        ----------
+        stoichiometry : Dict[str, float]
+            Signed coefficients of the forward reaction: negative for
+            substrates, positive for products.
         """
         self.name = name
         self.enzyme = enzyme
         self.substrates = substrates
         self.products = products
         self.reversible = reversible
+        self.stoichiometry = {name: -amount for name, amount in substrates.items()}
+        for product, amount in products.items():
+            self.stoichiometry[product] = self.stoichiometry.get(product, 0) + amount
 
     def can_react(self, organelle: "Organelle") -> bool:
         """
@@ -103,18 +112,19 @@ class Reaction:
 
         substrates, products = self._get_reaction_direction(reverse)
 
+        # Read each substrate once; the cached quantities serve both the
+        # logging below and the execution path
+        get_quantity = organelle.get_metabolite_quantity
+        substrate_quantities = {met: get_quantity(met) for met in substrates}
+
         logger.info(f"Executing {self.name} reaction {'(reversed)' if reverse else ''}")
         logger.info(f"Substrates: {substrates}")
         logger.info(f"Products: {products}")
         for substrate, amount in substrates.items():
-            available = organelle.get_metabolite_quantity(substrate)
+            available = substrate_quantities[substrate]
             logger.info(f"{substrate} - Required: {amount}, Available: {available}")
 
         try:
-            # Cache substrate quantities
-            substrate_quantities = {
-                met: organelle.get_metabolite_quantity(met) for met in substrates
-            }
 
             if use_rates:
                 result = self._execute_with_rates(
@@ -217,13 +227,15 @@ class Reaction:
         # Log all limiting factors
         self._log_limiting_factors(limiting_factors, actual_rate)
 
+        change_quantity = organelle.change_metabolite_quantity
+
         # Consume metabolites
         for metabolite, amount in substrates.items():
-            organelle.change_metabolite_quantity(metabolite, -amount * actual_rate)
+            change_quantity(metabolite, -amount * actual_rate)
 
         # Produce metabolites
         for metabolite, amount in products.items():
-            organelle.change_metabolite_quantity(metabolite, amount * actual_rate)
+            change_quantity(metabolite, amount * actual_rate)
 
         # Add log entry
         self._log_metabolite_changes(substrates, products, actual_rate)
@@ -258,24 +270,30 @@ class Reaction:
         -------
         float: 1.0 if the reaction occurred, 0.0 otherwise.
         """
+        name = self.name
         for metabolite, amount in substrates.items():
             available = substrate_quantities[metabolite]
             if available < amount:
                 logger.error(
-                    f"Reaction '{self.name}': Insufficient {metabolite}. "
+                    f"Reaction '{name}': Insufficient {metabolite}. "
                     f"Required: {amount}, Available: {available}"
                 )
                 return 0.0
 
+        change_quantity = organelle.change_metabolite_quantity
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         # Consume substrates
         for metabolite, amount in substrates.items():
-            organelle.change_metabolite_quantity(metabolite, -amount)
-            logger.debug(f"Reaction '{self.name}': Consumed {amount} {metabolite}")
+            change_quantity(metabolite, -amount)
+            if debug_enabled:
+                logger.debug(f"Reaction '{name}': Consumed {amount} {metabolite}")
 
         # Produce products
         for metabolite, amount in products.items():
-            organelle.change_metabolite_quantity(metabolite, amount)
-            logger.debug(f"Reaction '{self.name}': Produced {amount} {metabolite}")
+            change_quantity(metabolite, amount)
+            if debug_enabled:
+                logger.debug(f"Reaction '{name}': Produced {amount} {metabolite}")
 
         # Add log entry
         self._log_metabolite_changes(substrates, products, 1.0)
@@ -321,10 +339,8 @@ class Reaction:
     def _calculate_energy_change(self, organelle: "Organelle") -> float:
         # This is a simplified calculation and should be refined based on actual biochemical data
         energy_change = 0
-        for product, amount in self.products.items():
-            energy_change += amount * organelle.get_metabolite_energy(product)
-        for substrate, amount in self.substrates.items():
-            energy_change -= amount * organelle.get_metabolite_energy(substrate)
+        for metabolite, coefficient in self.stoichiometry.items():
+            energy_change += coefficient * organelle.get_metabolite_energy(metabolite)
         return energy_change
 
 
@@ -6,13 +6,16 @@ class Reporter:
     """
     A class to report events and log messages during the simulation.
 
+    Logging methods accept %-style args after the message, which are only
+    formatted when the record is emitted.
+
     Methods
     -------
-    log_event(message: str) -> None:
+    log_event(message: str, *args) -> None:
         Log an event message.
-    log_warning(message: str) -> None:
+    log_warning(message: str, *args) -> None:
         Log a warning message.
-    log_error(message: str) -> None:
+    log_error(message: str, *args) -> None:
         Log an error message.
     log_atp_production(step: str, atp_produced: float) -> None:
         Log the ATP production for a specific step.
@@ -41,81 +44,84 @@ class Reporter:
 
         self.atp_production_log = []
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """
         Log an info message.
         """
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """
         Log a warning message.
         """
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """
         Log a debug message.
         """
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def log_event(self, message: str) -> None:
+    def log_event(self, message: str, *args) -> None:
         """
         Log an event message.
         """
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def log_warning(self, message: str) -> None:
+    def log_warning(self, message: str, *args) -> None:
         """
         Log a warning message.
         """
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def log_error(self, message: str) -> None:
+    def log_error(self, message: str, *args) -> None:
         """
         Log an error message.
         """
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
     def log_atp_production(self, step: str, atp_produced: float) -> None:
         """
         Log the ATP production for a specific step.
         """
         self.atp_production_log.append((step, atp_produced))
-        self.log_event(f"ATP produced in {step}: {atp_produced}")
+        self.log_event("ATP produced in %s: %s", step, atp_produced)
 
     def report_simulation_results(self, results: dict) -> None:
         """
         Report the simulation results.
         """
         self.log_event(
-            f"Simulation completed in {results['simulation_time']:.2f} seconds"
+            "Simulation completed in %.2f seconds", results["simulation_time"]
         )
-        self.log_event(f"Total ATP produced: {results['total_atp_produced']:.2f}")
-        self.log_event(f"Glucose processed: {results['glucose_processed']:.2f}")
-        self.log_event(f"Glucose consumed: {results['glucose_consumed']:.2f}")
-        self.log_event(f"Pyruvate produced: {results['pyruvate_produced']:.2f}")
-        self.log_event(f"Oxygen remaining: {results['oxygen_remaining']:.2f}")
-        self.log_event(f"Final cytoplasm ATP: {results['final_cytoplasm_atp']:.2f}")
+        self.log_event("Total ATP produced: %.2f", results["total_atp_produced"])
+        self.log_event("Glucose processed: %.2f", results["glucose_processed"])
+        self.log_event("Glucose consumed: %.2f", results["glucose_consumed"])
+        self.log_event("Pyruvate produced: %.2f", results["pyruvate_produced"])
+        self.log_event("Oxygen remaining: %.2f", results["oxygen_remaining"])
+        self.log_event("Final cytoplasm ATP: %.2f", results["final_cytoplasm_atp"])
         self.log_event(
-            f"Final mitochondrion ATP: {results['final_mitochondrion_atp']:.2f}"
+            "Final mitochondrion ATP: %.2f", results["final_mitochondrion_atp"]
         )
         self.log_event(
-            f"2-Phosphoglycerate remaining: {results['final_phosphoglycerate_2']:.2f}"
+            "2-Phosphoglycerate remaining: %.2f", results["final_phosphoglycerate_2"]
         )
         self.log_event(
-            f"Phosphoenolpyruvate produced: {results['final_phosphoenolpyruvate']:.2f}"
+            "Phosphoenolpyruvate produced: %.2f", results["final_phosphoenolpyruvate"]
         )
 
-        self.log_event("\nATP Production Breakdown:")
-        for step, atp in self.atp_production_log:
-            self.log_event(f"  {step}: {atp:.2f}")
+        self.log_event(
+            "\n".join(
+                ["\nATP Production Breakdown:"]
+                + [f"  {step}: {atp:.2f}" for step, atp in self.atp_production_log]
+            )
+        )
 
         self.atp_production_log.clear()  # Clear the log for the next simulation
 
     # Add this new method
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """
         Log an error message (alias for log_error).
         """
-        self.log_error(message)
+        self.log_error(message, *args)
@@ -92,7 +92,9 @@ class SimulationController:
             adjustment = adenine_before - adenine_after
             self.cell.cytoplasm.metabolites["ADP"].quantity += adjustment
             self.reporter.log_event(
-                f"Adjusted ADP by {adjustment:.6f} to maintain adenine nucleotide balance after glycolysis"
+                "Adjusted ADP by %.6f to maintain adenine nucleotide balance "
+                "after glycolysis",
+                adjustment,
             )
 
     def run_simulation(self, glucose: float, reporter: Reporter) -> dict:
@@ -130,35 +132,45 @@ class SimulationController:
                 f"Initial ATP: {self.initial_atp}, Initial ADP: {self.initial_adp}, Initial AMP: {self.initial_amp}"
             )
 
-            next_log_time = 0
+            # The loop bounds and metabolites are fixed for the whole run, so
+            # resolve them once rather than on every tick. Resets restore
+            # quantities in place, so the references stay valid.
+            time_step = self.time_step
+            max_simulation_time = self.max_simulation_time
+            cytoplasm_metabolites = self.cell.cytoplasm.metabolites
+            mitochondrion_metabolites = self.cell.mitochondrion.metabolites
+            glucose_metabolite = self.cell.metabolites["glucose"]
+            cytoplasm_atp = cytoplasm_metabolites["ATP"]
+            mitochondrion_atp = mitochondrion_metabolites["ATP"]
+            cytoplasm_adenines = tuple(
+                (name, cytoplasm_metabolites[name]) for name in ("ATP", "ADP", "AMP")
+            )
+            perform_glycolysis = Glycolysis.perform
+            log_event = reporter.log_event
+            log_atp_production = reporter.log_atp_production
+
+            # Log on an integer tick schedule; accumulating float times drifts
+            log_interval_ticks = max(1, round(10 / time_step))
+            tick = 0
+            next_log_tick = 0
             while (
                 glucose_processed < glucose
-                and self.simulation_time < self.max_simulation_time
+                and self.simulation_time < max_simulation_time
             ):
                 try:
-                    glucose_available = self.cell.metabolites["glucose"].quantity
-                    reporter.log_event(f"glucose_available: {glucose_available}")
+                    glucose_available = glucose_metabolite.quantity
+                    log_event("glucose_available: %s", glucose_available)
                     if glucose_available < 1:
                         reporter.log_warning(
                             "Insufficient glucose for glycolysis. Stopping simulation."
                         )
                         break
 
-                    # Store ATP and ADP levels before reactions
-                    atp_before = (
-                        self.cell.cytoplasm.metabolites["ATP"].quantity
-                        + self.cell.mitochondrion.metabolites["ATP"].quantity
-                    )
-                    adp_before = (
-                        self.cell.cytoplasm.metabolites["ADP"].quantity
-                        + self.cell.mitochondrion.metabolites["ADP"].quantity
-                    )
-
                     # Add this line to track adenine nucleotides before each step
                     adenine_before = self._calculate_total_adenine_nucleotides()
 
                     # Perform glycolysis
-                    net_atp_produced, pyruvate_produced = Glycolysis.perform(
+                    net_atp_produced, pyruvate_produced = perform_glycolysis(
                         self.cell, glucose_available, self.reporter
                     )
 
@@ -175,79 +187,65 @@ class SimulationController:
                     glucose_processed += glucose_available
                     total_atp_produced += net_atp_produced
 
-                    # Update ATP levels
-                    self.cell.cytoplasm.metabolites["ATP"].quantity += net_atp_produced
+                    # Glycolysis ran on the cell's own store, which is separate
+                    # from the cytoplasm's; credit its net ATP to the cytoplasm
+                    # pool that homeostasis and the results read
+                    cytoplasm_atp.quantity += net_atp_produced
 
-                    reporter.log_event(
-                        f"ATP produced in this iteration: {net_atp_produced}"
-                    )
-                    reporter.log_event(
-                        f"Total ATP produced so far: {total_atp_produced}"
-                    )
+                    log_event("ATP produced in this iteration: %s", net_atp_produced)
+                    log_event("Total ATP produced so far: %s", total_atp_produced)
 
-                    reporter.log_atp_production("Glycolysis", net_atp_produced)
+                    log_atp_production("Glycolysis", net_atp_produced)
 
                     # Check if there is enough glucose
-                    if self.cell.metabolites["glucose"].quantity <= 0:
+                    if glucose_metabolite.quantity <= 0:
                         reporter.log_warning("Glucose depleted. Stopping simulation.")
                         break
 
-                    # Check and handle ADP availability
-                    self._handle_adp_availability()
-
-                    # Implement feedback activation
-                    self._apply_feedback_activation()
+                    # Balance ADP/ATP pools and apply feedback activation
+                    self._apply_homeostasis()
 
                     # Handle NADH shuttle
                     self._handle_nadh_shuttle()
 
                     # Perform cellular respiration
-                    mitochondrial_atp_before = self.cell.mitochondrion.metabolites[
-                        "atp"
-                    ].quantity
+                    mitochondrial_atp_before = mitochondrion_atp.quantity
                     #! Pausing for now
                     # mitochondrial_atp = self.cell.mitochondrion.cellular_respiration(pyruvate_produced)
 
                     mitochondrial_atp_produced = round(
-                        self.cell.mitochondrion.metabolites["atp"].quantity
-                        - mitochondrial_atp_before,
+                        mitochondrion_atp.quantity - mitochondrial_atp_before,
                         2,
                     )
 
-                    reporter.log_atp_production(
+                    log_atp_production(
                         "Cellular Respiration", mitochondrial_atp_produced
                     )
 
-                    # Transfer excess ATP from mitochondrion to cytoplasm
-                    self._transfer_excess_atp()
-
                     # Ensure metabolite quantities don't exceed limits
                     self._enforce_metabolite_limits()
 
-                    self.simulation_time = round(
-                        self.simulation_time + self.time_step, 2
-                    )
+                    self.simulation_time = round(self.simulation_time + time_step, 2)
 
-                    if self.simulation_time >= next_log_time:
-                        self._log_intermediate_state()
-                        next_log_time = round(
-                            next_log_time + 10, 2
-                        )  # Schedule next log time
+                    tick += 1
+                    if tick >= next_log_tick:
+                        self._log_intermediate_state(reporter)
+                        next_log_tick += log_interval_ticks
 
-                    reporter.log_event(f"Simulation time: {self.simulation_time:.3f}")
+                    log_event("Simulation time: %.3f", self.simulation_time)
 
-                    self._check_adenine_nucleotide_balance()
-                    self._check_energy_conservation()
+                    self._check_adenine_nucleotide_balance(reporter)
+                    self._check_energy_conservation(reporter)
 
                     # Add this at the end of each iteration
                     self._check_and_adjust_adenine_balance()
 
                     # Ensure no negative quantities after adjustment
-                    for metabolite in ["ATP", "ADP", "AMP"]:
-                        if self.cell.cytoplasm.metabolites[metabolite].quantity < 0:
-                            self.cell.cytoplasm.metabolites[metabolite].quantity = 0
+                    for name, metabolite in cytoplasm_adenines:
+                        if metabolite.quantity < 0:
+                            metabolite.quantity = 0
                             reporter.log_warning(
-                                f"Set {metabolite} to 0 to avoid negative quantity"
+                                "Set %s to 0 to avoid negative quantity", name
                             )
 
                     # Run observers
@@ -383,94 +381,94 @@ class SimulationController:
             reporter.log_error(f"Simulation error: {str(e)}")
             raise
 
-    def _handle_adp_availability(self, reporter: Reporter) -> None:
+    def _apply_homeostasis(self) -> None:
         """
-        Handle the availability of ADP in the mitochondrion.
+        Balance the adenine nucleotide pools between the cytoplasm and
+        mitochondrion in a single pass.
+
+        Transfers ADP into the mitochondrion when it runs low, applies ADP
+        feedback activation to the glycolysis rate and moves excess ATP from
+        the mitochondrion to the cytoplasm.
         """
-        if self.cell.mitochondrion.metabolites["adp"].quantity < 10:
-            reporter.log_warning(
+        cytoplasm = self.cell.cytoplasm
+        cytoplasm_adp = cytoplasm.metabolites["adp"]
+        cytoplasm_atp = cytoplasm.metabolites["atp"]
+        mitochondrion_adp = self.cell.mitochondrion.metabolites["adp"]
+        mitochondrion_atp = self.cell.mitochondrion.metabolites["atp"]
+
+        # Handle ADP availability in the mitochondrion
+        if mitochondrion_adp.quantity < 10:
+            self.reporter.log_warning(
                 "Low ADP levels in mitochondrion. Transferring ADP from cytoplasm."
             )
-            adp_transfer = min(50, self.cell.metabolites["adp"].quantity)
-            self.cell.metabolites["adp"].quantity += adp_transfer
-            self.cell.metabolites["adp"].quantity -= adp_transfer
-
-    def _apply_feedback_activation(self) -> None:
-        """
-        Apply feedback activation based on ADP levels.
-        """
-        adp_activation_factor = 1 + self.cell.metabolites["adp"].quantity / 500
-        self.cell.cytoplasm.glycolysis_rate = (
-            self.base_glycolysis_rate * adp_activation_factor
-        )
+            cytoplasm_adp_quantity = cytoplasm_adp.quantity
+            adp_transfer = 50 if cytoplasm_adp_quantity > 50 else cytoplasm_adp_quantity
+            mitochondrion_adp.quantity += adp_transfer
+            cytoplasm_adp.quantity -= adp_transfer
+
+        # Feedback activation based on cytoplasmic ADP levels
+        adp_activation_factor = 1 + cytoplasm_adp.quantity / 500
+        cytoplasm.glycolysis_rate = self.base_glycolysis_rate * adp_activation_factor
+
+        # Transfer excess ATP from the mitochondrion to the cytoplasm
+        # Only ever move ATP out of the mitochondrion, and never past the
+        # cytoplasmic cap; a cytoplasm already above the cap takes nothing
+        atp_excess = mitochondrion_atp.quantity - self.max_mitochondrial_atp
+        headroom = self.max_cytoplasmic_atp - cytoplasm_atp.quantity
+        transfer_amount = atp_excess if atp_excess < headroom else headroom
+        if transfer_amount > 0:
+            mitochondrion_atp.quantity -= transfer_amount
+            cytoplasm_atp.quantity += transfer_amount
 
     def _handle_nadh_shuttle(self) -> None:
         """
         Handle the NADH shuttle between the cytoplasm and mitochondrion.
         """
         transfer_rate = 5  # Define a realistic transfer rate per time step
-        cytoplasmic_nadh = round(self.cell.metabolites["nadh"].quantity, 2)
-        nadh_to_transfer = round(min(transfer_rate, cytoplasmic_nadh), 2)
-        self.cell.mitochondrion.transfer_cytoplasmic_nadh(nadh_to_transfer)
-        self.cell.metabolites["nadh"].quantity = round(
-            self.cell.metabolites["nadh"].quantity - nadh_to_transfer, 2
-        )
-
-    def _transfer_excess_atp(self) -> None:
-        """
-        Transfer excess ATP from the mitochondrion to the cytoplasm.
-        """
-        atp_excess = max(
-            0,
-            self.cell.metabolites["atp"].quantity - self.max_mitochondrial_atp,
-        )
-        transfer_amount = min(
-            atp_excess,
-            self.max_cytoplasmic_atp - self.cell.metabolites["atp"].quantity,
+        nadh = self.cell.metabolites["nadh"]
+        cytoplasmic_nadh = round(nadh.quantity, 2)
+        nadh_to_transfer = round(
+            transfer_rate if transfer_rate < cytoplasmic_nadh else cytoplasmic_nadh, 2
         )
-
-        self.cell.metabolites["atp"].quantity += transfer_amount
-        self.cell.metabolites["atp"].quantity -= transfer_amount
+        self.cell.mitochondrion.transfer_cytoplasmic_nadh(nadh_to_transfer)
+        nadh.quantity = round(nadh.quantity - nadh_to_transfer, 2)
 
     def _enforce_metabolite_limits(self) -> None:
         """
         Enforce the limits for mitochondrial and cytoplasmic metabolites.
         """
+        atp = self.cell.metabolites["atp"]
+        nadh = self.cell.metabolites["nadh"]
+
         # Limit mitochondrial metabolites
-        self.cell.metabolites["atp"].quantity = min(
-            self.cell.metabolites["atp"].quantity,
-            self.max_mitochondrial_atp,
-        )
-        self.cell.metabolites["nadh"].quantity = min(
-            self.cell.metabolites["nadh"].quantity,
-            self.max_mitochondrial_nadh,
-        )
+        if atp.quantity > self.max_mitochondrial_atp:
+            atp.quantity = self.max_mitochondrial_atp
+        if nadh.quantity > self.max_mitochondrial_nadh:
+            nadh.quantity = self.max_mitochondrial_nadh
 
         # Limit cytoplasmic metabolites
-        self.cell.metabolites["atp"].quantity = min(
-            self.cell.metabolites["atp"].quantity, self.max_cytoplasmic_atp
-        )
-        self.cell.metabolites["nadh"].quantity = min(
-            self.cell.metabolites["nadh"].quantity, self.max_cytoplasmic_nadh
-        )
+        if atp.quantity > self.max_cytoplasmic_atp:
+            atp.quantity = self.max_cytoplasmic_atp
+        if nadh.quantity > self.max_cytoplasmic_nadh:
+            nadh.quantity = self.max_cytoplasmic_nadh
 
     def _log_intermediate_state(self, reporter: Reporter) -> None:
         """
         Log the intermediate state of the simulation.
         """
         state = self.get_current_state()
-        reporter.log_event(f"Time: {state['simulation_time']:.2f} s")
+        reporter.log_event("Time: %.2f s", state["simulation_time"])
         if "glucose_processed" in state:
-            reporter.log_event(f"Glucose Processed: {state['glucose_processed']:.2f}")
+            reporter.log_event("Glucose Processed: %.2f", state["glucose_processed"])
         else:
             reporter.log_event("Glucose Processed: Not available")
-        reporter.log_event(f"Total ATP Produced: {state['total_atp_produced']:.2f}")
-        reporter.log_event(f"Cytoplasm ATP: {state['cytoplasm_atp']:.2f}")
-        reporter.log_event(f"Mitochondrion ATP: {state['mitochondrion_atp']:.2f}")
-        reporter.log_event(f"Proton Gradient: {state['proton_gradient']:.2f}")
-        reporter.log_event(f"Oxygen Remaining: {state['oxygen_remaining']:.2f}")
-        reporter.log_event(f"NAD+: {state['nad']:.2f}")
-        reporter.log_event(f"NADH: {state['nadh']:.2f}")
+        reporter.log_event("Total ATP Produced: %.2f", state["total_atp_produced"])
+        reporter.log_event("Cytoplasm ATP: %.2f", state["cytoplasm_atp"])
+        reporter.log_event("Mitochondrion ATP: %.2f", state["mitochondrion_atp"])
+        reporter.log_event("Proton Gradient: %.2f", state["proton_gradient"])
+        reporter.log_event("Oxygen Remaining: %.2f", state["oxygen_remaining"])
+        reporter.log_event("NAD+: %.2f", state["nad"])
+        reporter.log_event("NADH: %.2f", state["nadh"])
 
     def get_current_state(self) -> dict:
         """
@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+
+from pyology.exceptions import GlycolysisError
+from pyology.glycolysis import Glycolysis
+from pyology.organelle import Organelle
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def organelle():
+    org = Organelle()
+    metabolites = {
+        "glucose": 5,
+        "ATP": 5,
+        "ADP": 10,
+        "NAD+": 10,
+        "NADH": 0,
+        "Pi": 10,
+        "H2O": 0,
+        "pyruvate": 0,
+    }
+    for name, quantity in metabolites.items():
+        org.add_metabolite(name, "test", quantity, 100)
+    return org
+
+
+def test_perform_applies_net_stoichiometry(organelle):
+    net_atp, pyruvate = Glycolysis.perform(organelle, 2, logger)
+
+    assert (net_atp, pyruvate) == (4, 4)
+    assert organelle.get_metabolite_quantity("glucose") == 3
+    assert organelle.get_metabolite_quantity("ATP") == 9
+    assert organelle.get_metabolite_quantity("ADP") == 6
+    assert organelle.get_metabolite_quantity("NAD+") == 6
+    assert organelle.get_metabolite_quantity("NADH") == 4
+
+
+def test_perform_requires_investment_atp(organelle):
+    organelle.set_metabolite_quantity("ATP", 1)
+
+    with pytest.raises(GlycolysisError):
+        Glycolysis.perform(organelle, 1, logger)
+    assert organelle.get_metabolite_quantity("glucose") == 5
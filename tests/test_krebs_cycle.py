@@ -0,0 +1,19 @@
+import unittest
+
+from pyology.krebs_cycle import KrebsCycle
+
+
+class TestKrebsCycle(unittest.TestCase):
+
+    def test_stoichiometric_yield(self):
+        nadh, fadh2, gtp = KrebsCycle.stoichiometric_yield(2)
+        self.assertEqual(nadh, 2 * KrebsCycle.NADH_PER_CYCLE)
+        self.assertEqual(fadh2, 2 * KrebsCycle.FADH2_PER_CYCLE)
+        self.assertEqual(gtp, 2 * KrebsCycle.GTP_PER_CYCLE)
+
+    def test_stoichiometric_yield_zero(self):
+        self.assertEqual(KrebsCycle.stoichiometric_yield(0), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from pyology.exceptions import InsufficientMetaboliteError
+
+from pyology.metabolite import Metabolite, Metabolites
+
+
+class TestMetabolite(unittest.TestCase):
+    def setUp(self):
+        self.metabolite = Metabolite("ATP", 50, 100)
+
+    def test_initial_quantity(self):
+        self.assertEqual(self.metabolite.initial_quantity, 50.0)
+        self.metabolite.quantity = 75
+        self.assertEqual(self.metabolite.initial_quantity, 50.0)
+
+    def test_restore(self):
+        self.metabolite.quantity = 75
+        self.metabolite.restore()
+        self.assertEqual(self.metabolite.quantity, 50)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.metabolite, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.metabolite.unknown_attribute = 1
+
+
+class TestMetabolites(unittest.TestCase):
+    def setUp(self):
+        self.metabolites = Metabolites()
+        self.metabolites.register("ATP", 50, 100)
+
+    def test_lookup_is_case_insensitive(self):
+        self.assertIn("atp", self.metabolites)
+        self.assertIs(self.metabolites.get("Atp"), self.metabolites["ATP"])
+
+    def test_restore_keeps_metabolite_objects(self):
+        atp = self.metabolites["atp"]
+        atp.quantity = 10
+        self.metabolites.restore()
+        self.assertIs(self.metabolites["atp"], atp)
+        self.assertEqual(atp.quantity, 50)
+
+    def test_consume_and_produce(self):
+        self.metabolites.consume(atp=20)
+        self.assertEqual(self.metabolites["atp"].quantity, 30)
+        self.metabolites.produce(atp=5)
+        self.assertEqual(self.metabolites["atp"].quantity, 35)
+        with self.assertRaises(InsufficientMetaboliteError):
+            self.metabolites.consume(atp=40)
+
+    def test_apply_delta_is_all_or_nothing(self):
+        self.metabolites.register("ADP", 10, 100)
+        with self.assertRaises(InsufficientMetaboliteError):
+            self.metabolites._apply_delta([("atp", 20), ("adp", 20)], -1)
+        self.assertEqual(self.metabolites["atp"].quantity, 50)
+        self.assertEqual(self.metabolites["adp"].quantity, 10)
+
+    def test_apply_delta_floor(self):
+        self.metabolites["atp"].min_quantity = 40
+        with self.assertRaises(InsufficientMetaboliteError):
+            self.metabolites._apply_delta([("atp", 20)], -1)
+        self.metabolites._apply_delta([("atp", 20)], -1, floor=0)
+        self.assertEqual(self.metabolites["atp"].quantity, 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -337,3 +337,173 @@
 # if __name__ == "__main__":
 #     unittest.main()
 
+
+import contextlib
+import io
+import unittest
+
+from pyology.constants import PROTONS_PER_ATP, PROTONS_PER_FADH2, PROTONS_PER_NADH
+from pyology.mitochondrion import Mitochondrion
+
+
+class TestMitochondrionSetup(unittest.TestCase):
+
+    def test_init_prints_nothing(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            mito = Mitochondrion()
+        self.assertEqual(stdout.getvalue(), "")
+        for name in ("nadh", "fadh2", "oxygen", "adp", "atp"):
+            self.assertIn(name, mito.metabolites)
+
+    def test_reset_keeps_bound_references(self):
+        mito = Mitochondrion()
+        atp = mito.metabolites["atp"]
+        atp.quantity = 50
+        mito.proton_gradient = 120
+        mito.reset()
+        self.assertEqual(mito.proton_gradient, 0)
+        self.assertIs(mito._m_atp, atp)
+        self.assertIs(mito.metabolites["atp"], atp)
+        self.assertEqual(atp.quantity, atp.initial_quantity)
+
+
+class TestKrebsCycleProcess(unittest.TestCase):
+
+    def setUp(self):
+        self.mito = Mitochondrion()
+
+    def test_products_added_to_mitochondrion(self):
+        self.mito.metabolites["oxaloacetate"].quantity = 5
+        electron_carriers = self.mito.krebs_cycle_process(2)
+        self.assertEqual(electron_carriers, 8)
+        self.assertEqual(self.mito.metabolites["nadh"].quantity, 6)
+        self.assertEqual(self.mito.metabolites["fadh2"].quantity, 2)
+        self.assertEqual(self.mito.metabolites["atp"].quantity, 2)
+
+    def test_insufficient_oxaloacetate(self):
+        self.assertEqual(self.mito.krebs_cycle_process(2), 0)
+        self.assertEqual(self.mito.metabolites["nadh"].quantity, 0)
+
+
+class TestElectronTransportChain(unittest.TestCase):
+
+    def setUp(self):
+        self.mito = Mitochondrion()
+        self.metabolites = self.mito.metabolites
+
+    def set_quantities(self, **quantities):
+        for name, quantity in quantities.items():
+            self.metabolites[name].quantity = quantity
+
+    def expected_gradient(self, *pumped):
+        # Mirror _pump_protons: each pumping step is followed by the leak
+        gradient = 0
+        for protons in pumped:
+            gradient += protons
+            gradient -= self.mito.calculate_proton_leak(gradient)
+        return gradient
+
+    def test_complex_I_rate_limited_by_ubiquinone(self):
+        self.set_quantities(nadh=10, ubiquinone=4)
+        self.assertEqual(self.mito.complex_I(), 4)
+        self.assertEqual(self.metabolites["nadh"].quantity, 6)
+        self.assertEqual(self.metabolites["ubiquinone"].quantity, 0)
+        self.assertEqual(self.metabolites["ubiquinol"].quantity, 4)
+        self.assertAlmostEqual(
+            self.mito.proton_gradient, self.expected_gradient(4 * PROTONS_PER_NADH)
+        )
+
+    def test_complex_I_insufficient_nadh(self):
+        self.set_quantities(nadh=0, ubiquinone=4)
+        with self.assertLogs("pyology.mitochondrion", level="WARNING") as log:
+            self.assertEqual(self.mito.complex_I(), 0)
+        self.assertIn("Insufficient NADH or ubiquinone", log.output[0])
+        self.assertEqual(self.metabolites["ubiquinone"].quantity, 4)
+        self.assertEqual(self.mito.proton_gradient, 0)
+
+    def test_complex_II_pumps_no_protons(self):
+        self.set_quantities(fadh2=3, ubiquinone=10)
+        self.assertEqual(self.mito.complex_II(), 3)
+        self.assertEqual(self.metabolites["fadh2"].quantity, 0)
+        self.assertEqual(self.metabolites["ubiquinone"].quantity, 7)
+        self.assertEqual(self.metabolites["ubiquinol"].quantity, 3)
+        self.assertEqual(self.mito.proton_gradient, 0)
+
+    def test_complex_III_rate_limited_by_cytochrome_c(self):
+        self.set_quantities(ubiquinol=5, cytochrome_c_oxidized=2)
+        self.assertEqual(self.mito.complex_III(), 2)
+        self.assertEqual(self.metabolites["ubiquinol"].quantity, 3)
+        self.assertEqual(self.metabolites["ubiquinone"].quantity, 2)
+        self.assertEqual(self.metabolites["cytochrome_c_oxidized"].quantity, 0)
+        self.assertEqual(self.metabolites["cytochrome_c_reduced"].quantity, 2)
+        self.assertAlmostEqual(
+            self.mito.proton_gradient, self.expected_gradient(2 * PROTONS_PER_FADH2)
+        )
+
+    def test_complex_IV_rate_limited_by_oxygen(self):
+        self.set_quantities(cytochrome_c_reduced=6, oxygen=1)
+        # Two cytochrome c per O2
+        self.assertEqual(self.mito.complex_IV(), 2)
+        self.assertEqual(self.metabolites["oxygen"].quantity, 0)
+        self.assertEqual(self.metabolites["cytochrome_c_reduced"].quantity, 4)
+        self.assertEqual(self.metabolites["cytochrome_c_oxidized"].quantity, 2)
+        self.assertAlmostEqual(
+            self.mito.proton_gradient, self.expected_gradient(2 * PROTONS_PER_FADH2)
+        )
+
+    def test_complex_IV_without_oxygen(self):
+        self.set_quantities(cytochrome_c_reduced=6, oxygen=0)
+        with self.assertLogs("pyology.mitochondrion", level="WARNING") as log:
+            self.assertEqual(self.mito.complex_IV(), 0)
+        self.assertIn("Insufficient oxygen", log.output[0])
+        self.assertEqual(self.metabolites["cytochrome_c_reduced"].quantity, 6)
+
+    def test_oxidative_phosphorylation_without_oxygen(self):
+        self.set_quantities(nadh=10, ubiquinone=10, oxygen=0, adp=10)
+        self.assertEqual(self.mito.oxidative_phosphorylation(), 0)
+        self.assertEqual(self.metabolites["nadh"].quantity, 10)
+        self.assertEqual(self.metabolites["adp"].quantity, 10)
+        self.assertEqual(self.mito.proton_gradient, 0)
+
+    def test_oxidative_phosphorylation_replenishes_carriers(self):
+        self.set_quantities(
+            nadh=10, ubiquinone=10, cytochrome_c_oxidized=4, oxygen=1, adp=100
+        )
+        gradient = self.expected_gradient(
+            10 * PROTONS_PER_NADH, 4 * PROTONS_PER_FADH2, 2 * PROTONS_PER_FADH2
+        )
+        expected_atp = int(gradient / PROTONS_PER_ATP)
+
+        self.assertEqual(self.mito.oxidative_phosphorylation(), expected_atp)
+        self.assertEqual(self.metabolites["nadh"].quantity, 0)
+        # Complex IV ran out of oxygen after two cytochrome c
+        self.assertEqual(self.metabolites["oxygen"].quantity, 0)
+        self.assertEqual(self.metabolites["atp"].quantity, expected_atp)
+        self.assertEqual(self.metabolites["adp"].quantity, 100 - expected_atp)
+        self.assertAlmostEqual(
+            self.mito.proton_gradient, gradient - expected_atp * PROTONS_PER_ATP
+        )
+        # Leftover reduced carriers are oxidized again
+        self.assertEqual(self.metabolites["ubiquinol"].quantity, 0)
+        self.assertEqual(self.metabolites["ubiquinone"].quantity, 10)
+        self.assertEqual(self.metabolites["cytochrome_c_reduced"].quantity, 0)
+        self.assertEqual(self.metabolites["cytochrome_c_oxidized"].quantity, 4)
+
+    def test_oxidative_phosphorylation_limited_by_adp(self):
+        self.set_quantities(
+            nadh=10, ubiquinone=10, cytochrome_c_oxidized=10, oxygen=10, adp=3
+        )
+        self.assertEqual(self.mito.oxidative_phosphorylation(), 3)
+        self.assertEqual(self.metabolites["adp"].quantity, 0)
+        self.assertEqual(self.metabolites["atp"].quantity, 3)
+        gradient = self.expected_gradient(
+            10 * PROTONS_PER_NADH, 10 * PROTONS_PER_FADH2, 10 * PROTONS_PER_FADH2
+        )
+        self.assertAlmostEqual(
+            self.mito.proton_gradient, gradient - 3 * PROTONS_PER_ATP
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from unittest.mock import patch
 from pyology.exceptions import (
     GlycolysisRateError,
     InsufficientMetaboliteError,
+    MetaboliteError,
     QuantityError,
     UnknownMetaboliteError,
 )
@@ -71,6 +72,12 @@ class TestOrganelle(unittest.TestCase):
                 "glucose", 2000
             )  # exceed max quantity
 
+    def test_change_metabolite_quantity_invalid_types(self):
+        with self.assertRaises(MetaboliteError):
+            self.organelle.change_metabolite_quantity(1, 50)
+        with self.assertRaises(MetaboliteError):
+            self.organelle.change_metabolite_quantity("glucose", "50")
+
     def test_is_metabolite_available(self):
         self.assertTrue(self.organelle.is_metabolite_available("atp", 50))
         self.assertFalse(self.organelle.is_metabolite_available("atp", 200))
@@ -87,6 +94,27 @@ class TestOrganelle(unittest.TestCase):
         with self.assertRaises(InsufficientMetaboliteError):
             self.organelle.consume_metabolites(atp=200)
 
+    def test_consume_metabolites_all_or_nothing(self):
+        self.organelle.add_metabolite("substrate_a", "test_type", 10, 100)
+        self.organelle.add_metabolite("substrate_b", "test_type", 1, 100)
+        with self.assertRaises(InsufficientMetaboliteError):
+            self.organelle.consume_metabolites(substrate_a=5, substrate_b=2)
+        self.assertEqual(self.organelle.metabolites["substrate_a"].quantity, 10)
+
+    def test_consume_metabolites_invalid_amount_leaves_state(self):
+        self.organelle.add_metabolite("substrate_a", "test_type", 10, 100)
+        self.organelle.add_metabolite("substrate_b", "test_type", 10, 100)
+        with self.assertRaises(MetaboliteError):
+            self.organelle.consume_metabolites(substrate_a=5, substrate_b=None)
+        self.assertEqual(self.organelle.metabolites["substrate_a"].quantity, 10)
+
+    def test_produce_metabolites_invalid_amount_leaves_state(self):
+        self.organelle.add_metabolite("product_a", "test_type", 10, 100)
+        self.organelle.add_metabolite("product_b", "test_type", 10, 100)
+        with self.assertRaises(MetaboliteError):
+            self.organelle.produce_metabolites(product_a=5, product_b="5")
+        self.assertEqual(self.organelle.metabolites["product_a"].quantity, 10)
+
     def test_produce_metabolites(self):
         initial_quantity = self.organelle.metabolites["glucose"].quantity
         self.organelle.produce_metabolites(glucose=50)
@@ -122,6 +150,16 @@ class TestOrganelle(unittest.TestCase):
         with self.assertRaises(UnknownMetaboliteError):
             self.organelle.get_metabolite("unknown_metabolite")
 
+    def test_reset_restores_in_place(self):
+        self.organelle.add_metabolite("substrate_a", "test_type", 10, 100)
+        substrate = self.organelle.metabolites["substrate_a"]
+        substrate.quantity = 60
+        self.organelle.glycolysis_rate = 2.0
+        self.organelle.reset()
+        self.assertIs(self.organelle.metabolites["substrate_a"], substrate)
+        self.assertEqual(substrate.quantity, 10)
+        self.assertEqual(self.organelle.glycolysis_rate, 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
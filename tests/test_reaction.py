@@ -33,6 +33,16 @@ class TestReaction(unittest.TestCase):
         
         self.organelle = Organelle()
 
+    def test_stoichiometry(self):
+        """Test that substrates are negative and products positive."""
+        reaction = Reaction(
+            name="A + B to C",
+            enzyme=self.enzyme,
+            substrates={"A": 1.0, "B": 2.0},
+            products={"C": 1.0},
+        )
+        self.assertEqual(reaction.stoichiometry, {"A": -1.0, "B": -2.0, "C": 1.0})
+
     def test_simple_reaction(self):
         """Test a simple reaction A -> B."""
         reaction = Reaction(
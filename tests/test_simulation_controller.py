@@ -185,5 +185,39 @@ class TestSimulationController(unittest.TestCase):
             print(f"  {key}: {value}")
 
 
+class TestApplyHomeostasis(unittest.TestCase):
+
+    def setUp(self):
+        # Only the attributes _apply_homeostasis reads are needed
+        self.cell = Cell([])
+        self.sim_controller = SimulationController.__new__(SimulationController)
+        self.sim_controller.cell = self.cell
+        self.sim_controller.reporter = Mock(spec=Reporter)
+        self.sim_controller.base_glycolysis_rate = 1.0
+        self.sim_controller.max_mitochondrial_atp = 100
+        self.sim_controller.max_cytoplasmic_atp = 500
+
+        self.cell.mitochondrion.metabolites["ADP"].quantity = 50
+        self.cell.cytoplasm.metabolites["ADP"].quantity = 50
+
+    def test_excess_atp_moves_to_cytoplasm(self):
+        self.cell.mitochondrion.metabolites["ATP"].quantity = 150
+        self.cell.cytoplasm.metabolites["ATP"].quantity = 10
+
+        self.sim_controller._apply_homeostasis()
+
+        self.assertEqual(self.cell.mitochondrion.metabolites["ATP"].quantity, 100)
+        self.assertEqual(self.cell.cytoplasm.metabolites["ATP"].quantity, 60)
+
+    def test_cytoplasm_above_cap_takes_no_atp(self):
+        self.cell.mitochondrion.metabolites["ATP"].quantity = 150
+        self.cell.cytoplasm.metabolites["ATP"].quantity = 600
+
+        self.sim_controller._apply_homeostasis()
+
+        self.assertEqual(self.cell.mitochondrion.metabolites["ATP"].quantity, 150)
+        self.assertEqual(self.cell.cytoplasm.metabolites["ATP"].quantity, 600)
+
+
 if __name__ == "__main__":
     unittest.main()